@@ -16,8 +16,7 @@ from export_intelligence.core.network import NetworkManager
 from export_intelligence.core.storage import StorageManager
 from export_intelligence.extractors import (
     ExtractionPipeline,
-    clean_html_preprocessor,
-    normalize_whitespace_preprocessor,
+    clean_and_normalize_preprocessor,
     required_fields_validator,
     market_compliance_validator,
     standardize_fields_transformer,
@@ -45,9 +44,8 @@ def setup_extraction_pipeline(config, storage_manager=None):
     """
     pipeline = ExtractionPipeline(config, storage_manager)
     
-    # Add preprocessors
-    pipeline.add_preprocessor(clean_html_preprocessor)
-    pipeline.add_preprocessor(normalize_whitespace_preprocessor)
+    # Add preprocessors (cleaning and whitespace normalization share one parse)
+    pipeline.add_preprocessor(clean_and_normalize_preprocessor)
     
     # Add validators
     pipeline.add_validator(required_fields_validator)
@@ -8,10 +8,24 @@ for different markets and product categories.
 import logging
 import json
 import os
+from types import MappingProxyType
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Common market name variations (lowercase, spaces removed) -> canonical key.
+# Read-only, since it is shared by every lookup.
+MARKET_NAME_ALIASES = MappingProxyType({
+    'unitedkingdom': 'uk',
+    'uk': 'uk',
+    'unitedstates': 'usa',
+    'usa': 'usa',
+    'us': 'usa',
+    'unitedarabemirates': 'uae',
+    'uae': 'uae',
+    'emirates': 'uae'
+})
+
 def load_market_intelligence_data():
     """
     Load market intelligence data from the MCP server.
@@ -273,18 +287,7 @@ def _normalize_market_name(market_name):
     normalized = market_name.lower().replace(' ', '')
     
     # Handle common market name variations
-    market_mapping = {
-        'unitedkingdom': 'uk',
-        'uk': 'uk',
-        'unitedstates': 'usa',
-        'usa': 'usa',
-        'us': 'usa',
-        'unitedarabemirates': 'uae',
-        'uae': 'uae',
-        'emirates': 'uae'
-    }
-    
-    return market_mapping.get(normalized, normalized)
+    return MARKET_NAME_ALIASES.get(normalized, normalized)
 
 def _calculate_opportunity_timeline(market_data):
     """
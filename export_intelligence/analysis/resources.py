@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 import json
 import math
 
-from export_intelligence.analysis.timeline import TIMELINE_TEMPLATES
+from export_intelligence.analysis.timeline import TIMELINE_TEMPLATES, parse_duration_range
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -132,7 +132,7 @@ def estimate_resource_requirements(industry, markets, timeline_option='standard'
                 # If regulatory process is longer than standard certification time, adjust timeline
                 cert_milestone = next((m for m in timeline['milestones'] if 'Certification' in m['label']), None)
                 if cert_milestone:
-                    cert_weeks = int(cert_milestone['duration'].split('-')[1].split()[0])
+                    _, cert_weeks = parse_duration_range(cert_milestone['duration'])
                     if max_doc_weeks > cert_weeks:
                         total_weeks += (max_doc_weeks - cert_weeks)
         
@@ -141,7 +141,7 @@ def estimate_resource_requirements(industry, markets, timeline_option='standard'
         end_date = start_date + timedelta(weeks=total_weeks)
         
         # Get team requirements for the selected timeline
-        team_reqs = TEAM_REQUIREMENTS.get(timeline_option, TEAM_REQUIREMENTS['standard'])
+        team_reqs = list(TEAM_REQUIREMENTS.get(timeline_option, TEAM_REQUIREMENTS['standard']))
         
         # Adjust team requirements based on markets and industry
         if len(markets) > 2:
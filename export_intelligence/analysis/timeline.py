@@ -6,12 +6,50 @@ and estimating project durations.
 """
 
 import logging
+import re
 from datetime import datetime, timedelta
+from types import MappingProxyType
 import json
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Durations like "4-6 weeks", "8 weeks" or "6-8 months"
+DURATION_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+def parse_duration_range(duration):
+    """
+    Parse a duration string into its lower and upper bounds.
+    
+    Args:
+        duration: Duration string such as "4-6 weeks" or "8 weeks"
+        
+    Returns:
+        Tuple of (min, max) integers; both are equal for a single value.
+        A string without a number raises ValueError.
+    """
+    match = DURATION_RE.search(duration)
+    if not match:
+        raise ValueError(f"No duration in '{duration}'")
+    low, high = match.groups()
+    return int(low), int(high or low)
+
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _thaw(value):
+    """Build a mutable deep copy of a frozen template."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
 # Standard timeline templates
 TIMELINE_TEMPLATES = {
     'standard': {
@@ -58,6 +96,10 @@ TIMELINE_TEMPLATES = {
     }
 }
 
+# Shared by every request, so the templates are read-only; callers that
+# adjust an option work on a _thaw()ed copy
+TIMELINE_TEMPLATES = _freeze(TIMELINE_TEMPLATES)
+
 def generate_timeline_options(industry, markets):
     """
     Generate export timeline options for the given industry and markets.
@@ -70,8 +112,8 @@ def generate_timeline_options(industry, markets):
         List of timeline options
     """
     try:
-        # Start with standard options
-        options = list(TIMELINE_TEMPLATES.values())
+        # Start with (mutable copies of) the standard options
+        options = [_thaw(template) for template in TIMELINE_TEMPLATES.values()]
         
         # Adjust options based on industry
         if industry == 'Food Products':
@@ -130,7 +172,7 @@ def generate_timeline_options(industry, markets):
     except Exception as e:
         logger.error(f"Error generating timeline options: {str(e)}")
         # Return default options if there's an error
-        return list(TIMELINE_TEMPLATES.values())
+        return [_thaw(template) for template in TIMELINE_TEMPLATES.values()]
 
 def estimate_project_duration(timeline_option, regulatory_documents=None):
     """
@@ -163,9 +205,9 @@ def estimate_project_duration(timeline_option, regulatory_documents=None):
                 for milestone in timeline['milestones']:
                     if 'Certification' in milestone['label']:
                         # Extract the upper bound of the duration range
-                        duration_parts = milestone['duration'].split('-')
-                        if len(duration_parts) > 1:
-                            cert_weeks = int(duration_parts[1].split()[0])
+                        match = DURATION_RE.search(milestone['duration'])
+                        if match and match.group(2):
+                            cert_weeks = int(match.group(2))
                             
                             # If regulatory documents take longer, adjust the timeline
                             if max_doc_weeks > cert_weeks:
@@ -209,13 +251,8 @@ def _calculate_milestone_dates(milestones, start_date):
     current_date = start_date
     
     for milestone in milestones:
-        # Extract the upper bound of the duration range
-        duration_parts = milestone['duration'].split('-')
-        if len(duration_parts) > 1:
-            weeks = int(duration_parts[1].split()[0])
-        else:
-            # If no range, just extract the number
-            weeks = int(duration_parts[0].split()[0])
+        # Extract the upper bound of the duration range (or the single value)
+        _, weeks = parse_duration_range(milestone['duration'])
         
         # Calculate end date
         end_date = current_date + timedelta(weeks=weeks)
@@ -245,7 +282,7 @@ def adjust_timeline_for_product_complexity(timeline_option, product_complexity):
     """
     try:
         # Get the base timeline
-        timeline = TIMELINE_TEMPLATES.get(timeline_option, TIMELINE_TEMPLATES['standard']).copy()
+        timeline = _thaw(TIMELINE_TEMPLATES.get(timeline_option, TIMELINE_TEMPLATES['standard']))
         
         # Skip adjustment if complexity is medium (3)
         if product_complexity == 3:
@@ -257,12 +294,10 @@ def adjust_timeline_for_product_complexity(timeline_option, product_complexity):
         # Adjust each milestone
         for milestone in timeline['milestones']:
             # Extract the duration range
-            duration_parts = milestone['duration'].split('-')
+            min_weeks, max_weeks = DURATION_RE.search(milestone['duration']).groups()
             
-            if len(duration_parts) > 1:
-                min_weeks = int(duration_parts[0].split()[0])
-                max_weeks = int(duration_parts[1].split()[0])
-                
+            if max_weeks:
+                min_weeks, max_weeks = int(min_weeks), int(max_weeks)
                 # Adjust based on complexity
                 if product_complexity > 3:  # More complex
                     new_min = int(min_weeks * (1 + adjustment_factor))
@@ -274,16 +309,13 @@ def adjust_timeline_for_product_complexity(timeline_option, product_complexity):
                 milestone['duration'] = f"{new_min}-{new_max} weeks"
             else:
                 # Handle single value durations
-                weeks = int(duration_parts[0].split()[0])
-                new_weeks = max(1, int(weeks * (1 + adjustment_factor)))
+                new_weeks = max(1, int(int(min_weeks) * (1 + adjustment_factor)))
                 milestone['duration'] = f"{new_weeks} weeks"
         
         # Adjust overall timeframe
-        timeframe_parts = timeline['timeframe'].split('-')
-        if len(timeframe_parts) > 1:
-            min_months = int(timeframe_parts[0])
-            max_months = int(timeframe_parts[1].split()[0])
-            
+        min_months, max_months = DURATION_RE.search(timeline['timeframe']).groups()
+        if max_months:
+            min_months, max_months = int(min_months), int(max_months)
             new_min = int(min_months * (1 + adjustment_factor))
             new_max = int(max_months * (1 + adjustment_factor))
             
@@ -296,4 +328,4 @@ def adjust_timeline_for_product_complexity(timeline_option, product_complexity):
     except Exception as e:
         logger.error(f"Error adjusting timeline for product complexity: {str(e)}")
         # Return the original timeline
-        return TIMELINE_TEMPLATES.get(timeline_option, TIMELINE_TEMPLATES['standard']) 
\ No newline at end of file
+        return _thaw(TIMELINE_TEMPLATES.get(timeline_option, TIMELINE_TEMPLATES['standard'])) 
\ No newline at end of file
@@ -8,9 +8,14 @@ import json
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 import subprocess
+import requests
 
 logger = logging.getLogger(__name__)
 
+# Shared across MCPClient instances (callers create one per call), so
+# connections to the MCP proxy stay alive between requests
+_session = requests.Session()
+
 class MCPClient:
     """Client for interacting with the MCP server through the AI Agent's MCPClient."""
     
@@ -36,8 +41,7 @@ class MCPClient:
         try:
             # In a production environment, this would use a proper IPC mechanism
             # For now, we'll use the proxy endpoint in the Flask backend
-            import requests
-            response = requests.post(
+            response = _session.post(
                 f"{self.base_url}/api/proxy/mcp/tools",
                 json={
                     "tool": tool,
@@ -9,6 +9,7 @@ import time
 import random
 import asyncio
 import logging
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin
 from urllib.robotparser import RobotFileParser
 
@@ -19,9 +20,23 @@ from fake_useragent import UserAgent
 # Configure logging
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _shared_user_agent():
+    """
+    Return the process-wide UserAgent.
+
+    Building a UserAgent loads its whole browser dataset, so every
+    NetworkManager draws random user agents from a single instance.
+    """
+    return UserAgent()
+
+
 class RateLimiter:
     """Rate limiter for making requests to specific domains."""
     
+    # One limiter is created per crawled domain, so skip the per-instance __dict__
+    __slots__ = ('requests_per_minute', 'interval', 'last_request_time')
+    
     def __init__(self, requests_per_minute=10):
         self.requests_per_minute = requests_per_minute
         self.interval = 60.0 / requests_per_minute
@@ -63,7 +78,7 @@ class NetworkManager:
         """
         self.config = config
         self.proxies = proxies or []
-        self.user_agent = UserAgent()
+        self.user_agent = _shared_user_agent()
         self.robots_cache = {}  # Cache for robots.txt parsers
         self.rate_limiters = {}  # Domain-specific rate limiters
         self.session = requests.Session()  # Reuse session for better performance
@@ -94,9 +109,17 @@ class NetworkManager:
         """Get a random proxy from the list."""
         return random.choice(self.proxies) if self.proxies else None
     
-    def _can_fetch(self, url, user_agent='*'):
-        """Check if the URL can be fetched according to robots.txt."""
-        parsed_url = urlparse(url)
+    def _can_fetch(self, url, user_agent='*', parsed_url=None):
+        """
+        Check if the URL can be fetched according to robots.txt.
+        
+        Args:
+            url: URL to check
+            user_agent: User agent the robots.txt rules are matched against
+            parsed_url: urlparse() result for url, if the caller already has one
+        """
+        if parsed_url is None:
+            parsed_url = urlparse(url)
         domain = parsed_url.netloc
         
         # Skip check for non-HTTP URLs
@@ -142,7 +165,7 @@ class NetworkManager:
         domain = parsed_url.netloc
         
         # Check robots.txt
-        if respect_robots and not self._can_fetch(url):
+        if respect_robots and not self._can_fetch(url, parsed_url=parsed_url):
             logger.warning(f"URL {url} disallowed by robots.txt")
             return {"success": False, "error": "Blocked by robots.txt"}
         
@@ -233,10 +256,17 @@ class NetworkManager:
         parsed_url = urlparse(url)
         domain = parsed_url.netloc
         
-        # Check robots.txt (reusing the sync implementation for simplicity)
-        if respect_robots and not self._can_fetch(url):
-            logger.warning(f"URL {url} disallowed by robots.txt")
-            return {"success": False, "error": "Blocked by robots.txt"}
+        # Check robots.txt (reusing the sync implementation for simplicity).
+        # An uncached robots.txt is fetched with blocking requests, so that
+        # runs in a worker thread to keep concurrent fetches from serializing.
+        if respect_robots:
+            if domain in self.robots_cache:
+                allowed = self._can_fetch(url, parsed_url=parsed_url)
+            else:
+                allowed = await asyncio.to_thread(self._can_fetch, url, parsed_url=parsed_url)
+            if not allowed:
+                logger.warning(f"URL {url} disallowed by robots.txt")
+                return {"success": False, "error": "Blocked by robots.txt"}
         
         # Apply rate limiting
         rate_limiter = self._get_rate_limiter(domain)
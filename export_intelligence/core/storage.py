@@ -16,6 +16,23 @@ from contextlib import contextmanager
 logger = logging.getLogger(__name__)
 
 
+def _fetch_dicts(cursor):
+    """
+    Fetch the remaining rows of a query as dictionaries.
+    The column names are read once per query and zipped with plain tuple
+    rows, instead of building an sqlite3.Row per row and converting it.
+    
+    Args:
+        cursor: Cursor with an executed query
+        
+    Returns:
+        list: List of row dictionaries
+    """
+    cursor.row_factory = None
+    columns = tuple(column[0] for column in cursor.description)
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
 class StorageManager:
     """Manages database operations with proper connection handling."""
     
@@ -28,6 +45,9 @@ class StorageManager:
             create_tables: Whether to create tables if they don't exist
         """
         self.db_path = db_path
+        # Row ids of stored companies, keyed by (table, website), so updating
+        # a known company skips the lookup query
+        self._website_ids = {}
         
         if create_tables:
             with self.get_connection() as conn:
@@ -145,6 +165,65 @@ class StorageManager:
         
         conn.commit()
     
+    def _upsert_by_website(self, cursor, table, data):
+        """
+        Update the row with the same website, or insert a new one.
+        
+        Args:
+            cursor: Cursor of an open connection
+            table: Table keyed by a unique website column
+            data: Dictionary of column values
+            
+        Returns:
+            int: ID of the inserted/updated row
+        """
+        website = data.get('website')
+        if website is not None:
+            key = (table, website)
+            
+            # Build update query dynamically based on available fields
+            columns = [column for column in data if column != 'website']
+            assignments = ', '.join(f"{column} = ?" for column in columns)
+            values = [data[column] for column in columns]
+            
+            row_id = self._website_ids.get(key)
+            if row_id is not None and columns:
+                # Trust the cached ID only while that row still holds this website
+                cursor.execute(
+                    f"UPDATE {table} SET {assignments} WHERE id = ? AND website = ?",
+                    (*values, row_id, website)
+                )
+                if cursor.rowcount:
+                    return row_id
+                
+                # The cached row is gone; look the company up again
+                self._website_ids.pop(key, None)
+            
+            # Check if the company already exists
+            cursor.execute(f"SELECT id FROM {table} WHERE website = ?", (website,))
+            result = cursor.fetchone()
+            if result:
+                row_id = result[0]
+                if columns:
+                    cursor.execute(
+                        f"UPDATE {table} SET {assignments} WHERE id = ?",
+                        (*values, row_id)
+                    )
+                self._website_ids[key] = row_id
+                return row_id
+        
+        # Insert new record
+        fields = ', '.join(data.keys())
+        placeholders = ', '.join(['?' for _ in data])
+        
+        cursor.execute(
+            f"INSERT INTO {table} ({fields}) VALUES ({placeholders})",
+            tuple(data.values())
+        )
+        if website is not None:
+            self._website_ids[(table, website)] = cursor.lastrowid
+        return cursor.lastrowid
+    
     def store_competitor(self, competitor_data):
         """
         Store a competitor in the database.
@@ -161,44 +240,9 @@ class StorageManager:
             cursor = conn.cursor()
             
             try:
-                # Check if competitor already exists
-                if 'website' in competitor_data:
-                    cursor.execute(
-                        "SELECT id FROM competitors WHERE website = ?", 
-                        (competitor_data['website'],)
-                    )
-                    result = cursor.fetchone()
-                    
-                    if result:
-                        # Update existing record
-                        comp_id = result[0]
-                        
-                        # Build update query dynamically based on available fields
-                        fields = [f"{key} = ?" for key in competitor_data.keys() if key != 'website']
-                        values = [competitor_data[key] for key in competitor_data.keys() if key != 'website']
-                        values.append(competitor_data['website'])
-                        
-                        if fields:
-                            cursor.execute(
-                                f"UPDATE competitors SET {', '.join(fields)} WHERE website = ?",
-                                tuple(values)
-                            )
-                            conn.commit()
-                        
-                        return comp_id
-                
-                # Insert new record
-                fields = ', '.join(competitor_data.keys())
-                placeholders = ', '.join(['?' for _ in competitor_data])
-                values = tuple(competitor_data.values())
-                
-                cursor.execute(
-                    f"INSERT INTO competitors ({fields}) VALUES ({placeholders})",
-                    values
-                )
-                
+                row_id = self._upsert_by_website(cursor, 'competitors', competitor_data)
                 conn.commit()
-                return cursor.lastrowid
+                return row_id
                 
             except sqlite3.Error as e:
                 logger.error(f"Error storing competitor: {e}")
@@ -221,43 +265,9 @@ class StorageManager:
             cursor = conn.cursor()
             
             try:
-                # Check if customer already exists
-                if 'website' in customer_data:
-                    cursor.execute(
-                        "SELECT id FROM customers WHERE website = ?", 
-                        (customer_data['website'],)
-                    )
-                    result = cursor.fetchone()
-                    
-                    if result:
-                        # Update existing record
-                        cust_id = result[0]
-                        
-                        # Build update query dynamically based on available fields
-                        fields = [f"{key} = ?" for key in customer_data.keys() if key != 'website']
-                        values = [customer_data[key] for key in customer_data.keys() if key != 'website']
-                        values.append(customer_data['website'])
-                        
-                        if fields:
-                            cursor.execute(
-                                f"UPDATE customers SET {', '.join(fields)} WHERE website = ?",
-                                tuple(values)
-                            )
-                        
-                        return cust_id
-                
-                # Insert new record
-                fields = ', '.join(customer_data.keys())
-                placeholders = ', '.join(['?' for _ in customer_data])
-                values = tuple(customer_data.values())
-                
-                cursor.execute(
-                    f"INSERT INTO customers ({fields}) VALUES ({placeholders})",
-                    values
-                )
-                
+                row_id = self._upsert_by_website(cursor, 'customers', customer_data)
                 conn.commit()
-                return cursor.lastrowid
+                return row_id
                 
             except sqlite3.Error as e:
                 logger.error(f"Error storing customer: {e}")
@@ -340,7 +350,7 @@ class StorageManager:
             cursor = conn.cursor()
             cursor.execute(query, params)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
     
     def get_customers(self, target_market=None, industry=None, limit=100):
         """
@@ -371,7 +381,7 @@ class StorageManager:
             cursor = conn.cursor()
             cursor.execute(query, params)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
     
     def get_products(self, target_market=None, company_type=None, min_price=None, max_price=None, limit=100):
         """
@@ -412,7 +422,7 @@ class StorageManager:
             cursor = conn.cursor()
             cursor.execute(query, params)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
     
     def get_product_stats(self, target_market, company_type=None):
         """
@@ -448,7 +458,7 @@ class StorageManager:
             cursor = conn.cursor()
             cursor.execute(query, params)
             
-            results = [dict(row) for row in cursor.fetchall()]
+            results = _fetch_dicts(cursor)
             
             # Organize by company_type and currency
             stats = {}
@@ -493,7 +503,7 @@ class StorageManager:
                 params.append(market)
             
             cursor.execute(query, params)
-            competitors = [dict(row) for row in cursor.fetchall()]
+            competitors = _fetch_dicts(cursor)
             
             competitors_file = os.path.join(target_dir, "competitors.json")
             with open(competitors_file, 'w') as f:
@@ -508,7 +518,7 @@ class StorageManager:
                 params.append(market)
             
             cursor.execute(query, params)
-            customers = [dict(row) for row in cursor.fetchall()]
+            customers = _fetch_dicts(cursor)
             
             customers_file = os.path.join(target_dir, "customers.json")
             with open(customers_file, 'w') as f:
@@ -523,7 +533,7 @@ class StorageManager:
                 params.append(market)
             
             cursor.execute(query, params)
-            products = [dict(row) for row in cursor.fetchall()]
+            products = _fetch_dicts(cursor)
             
             products_file = os.path.join(target_dir, "products.json")
             with open(products_file, 'w') as f:
@@ -19,6 +19,7 @@ from export_intelligence.extractors.pipeline import (
     HTMLFingerprinter,
     clean_html_preprocessor,
     normalize_whitespace_preprocessor,
+    clean_and_normalize_preprocessor,
     required_fields_validator,
     market_compliance_validator,
     standardize_fields_transformer,
@@ -36,6 +37,7 @@ __all__ = [
     'HTMLFingerprinter',
     'clean_html_preprocessor',
     'normalize_whitespace_preprocessor',
+    'clean_and_normalize_preprocessor',
     'required_fields_validator',
     'market_compliance_validator',
     'standardize_fields_transformer',
@@ -220,6 +220,7 @@ class AdaptiveExtractor(BaseExtractor):
             
         table_headers = pattern.get('structuredTableExtraction', {}).get('tableHeaders', [])
         required_nutrients = pattern.get('structuredTableExtraction', {}).get('requiredNutrients', [])
+        required_lower = [req.lower() for req in required_nutrients]
         
         for table in tables:
             # Check if this looks like a relevant table
@@ -228,7 +229,8 @@ class AdaptiveExtractor(BaseExtractor):
                 # Try first row if no th elements
                 headers = [td.get_text(strip=True) for td in table.find('tr').find_all('td')]
                 
-            if not any(header in ' '.join(headers) for header in table_headers):
+            header_text = ' '.join(headers)
+            if not any(header in header_text for header in table_headers):
                 continue
                 
             rows = table.find_all('tr')
@@ -242,7 +244,8 @@ class AdaptiveExtractor(BaseExtractor):
                     value = cells[1].get_text(strip=True)
                     
                     # Check if this is a nutrient we're interested in
-                    if any(req.lower() in nutrient.lower() for req in required_nutrients):
+                    nutrient_lower = nutrient.lower()
+                    if any(req in nutrient_lower for req in required_lower):
                         table_data[nutrient] = value
             
             if table_data:
@@ -297,6 +300,7 @@ class AdaptiveExtractor(BaseExtractor):
                 
             # Extract items from lists
             mandatory_items = pattern.get('structuredListExtraction', {}).get('mandatoryAllergens', [])
+            mandatory_lower = [mandatory.lower() for mandatory in mandatory_items]
             list_items = {}
             
             for lst in lists:
@@ -305,8 +309,9 @@ class AdaptiveExtractor(BaseExtractor):
                 # Check if this list contains mandatory items
                 matched_items = []
                 for item in items:
-                    for mandatory in mandatory_items:
-                        if mandatory.lower() in item.lower():
+                    item_lower = item.lower()
+                    for mandatory in mandatory_lower:
+                        if mandatory in item_lower:
                             matched_items.append(item)
                 
                 if matched_items:
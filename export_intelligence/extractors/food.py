@@ -45,6 +45,30 @@ FOOD_MARKERS = {
 }
 
 
+# Patterns run against the text of every matching element, compiled once
+STORAGE_TEMP_RE = re.compile(r'(store|keep) at ([<>]?[\-\d]+[\s]*[°℃CFcf])', re.IGNORECASE)
+SHELF_LIFE_RE = re.compile(r'shelf[\s\-]?life(\s+of)?\s+(\d+)\s+(day|month|year)s?', re.IGNORECASE)
+DATE_FORMAT_RE = re.compile(r'(best before|use by|expiry)[\s:]+([^\.]+)', re.IGNORECASE)
+SERVING_SIZE_RE = re.compile(r'serving size[:\s]+([^\.]+)', re.IGNORECASE)
+INGREDIENTS_RE = re.compile(r'ingredients[:\s]+([^\.]+)', re.IGNORECASE)
+CONTAINS_RE = re.compile(r'contains[:\s]+([^\.]+)', re.IGNORECASE)
+MAY_CONTAIN_RE = re.compile(r'may contain[:\s]+([^\.]+)', re.IGNORECASE)
+ORIGIN_RE = re.compile(r'(country of origin|made in|produce of|product of)[:\s]+([^\.]+)', re.IGNORECASE)
+TEMPERATURE_RE = re.compile(r'([<>]?[\-\d]+[\s]*[°℃CFcf])')
+E_NUMBER_RE = re.compile(r'E[ -]?\d{3,4}[a-z]?')
+ADDITIVE_NAME_RE = re.compile(r'(sodium benzoate|potassium sorbate|citric acid|aspartame|MSG)', re.IGNORECASE)
+ABV_RE = re.compile(r'(\d+(\.\d+)?)\s*%\s*(ABV|alcohol|vol)', re.IGNORECASE)
+ALCOHOL_WARNING_RE = re.compile(r'not (suitable|recommended) for (children|pregnant)', re.IGNORECASE)
+CAFFEINE_RE = re.compile(r'(\d+(\.\d+)?)\s*(mg|milligrams)(\s+of)?\s+caffeine', re.IGNORECASE)
+HIGH_CAFFEINE_RE = re.compile(r'high\s+caffeine\s+content', re.IGNORECASE)
+HEALTH_CLAIM_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(good source of|high in) ([^\.]+)',
+    r'(low|reduced|no|free from) ([^\.]+)',
+    r'(whole grain|natural ingredients|no artificial) ([^\.]*)',
+    r'(helps|supports|maintains|improves) ([^\.]+)'
+))
+
+
 class FoodProductExtractor(BaseExtractor):
     """Base extractor for food products with common functionality."""
     
@@ -125,18 +149,18 @@ class FoodProductExtractor(BaseExtractor):
             text = element.get_text(strip=True)
             
             # Look for storage temperature
-            temp_match = re.search(r'(store|keep) at ([<>]?[\-\d]+[\s]*[°℃CFcf])', text, re.IGNORECASE)
+            temp_match = STORAGE_TEMP_RE.search(text)
             if temp_match:
                 result['storage_temperature'] = temp_match.group(2)
                 
             # Look for shelf life duration
-            duration_match = re.search(r'shelf[\s\-]?life(\s+of)?\s+(\d+)\s+(day|month|year)s?', text, re.IGNORECASE)
+            duration_match = SHELF_LIFE_RE.search(text)
             if duration_match:
                 result['shelf_life_duration'] = duration_match.group(2)
                 result['shelf_life_unit'] = duration_match.group(3)
                 
             # Look for best before format
-            date_format_match = re.search(r'(best before|use by|expiry)[\s:]+([^\.]+)', text, re.IGNORECASE)
+            date_format_match = DATE_FORMAT_RE.search(text)
             if date_format_match:
                 result['date_format'] = date_format_match.group(2)
                 
@@ -182,7 +206,7 @@ class FoodProductExtractor(BaseExtractor):
         serving_elements = self.find_context_with_markers(soup, ['serving size', 'per serving'])
         for element in serving_elements:
             text = element.get_text(strip=True)
-            serving_match = re.search(r'serving size[:\s]+([^\.]+)', text, re.IGNORECASE)
+            serving_match = SERVING_SIZE_RE.search(text)
             if serving_match:
                 result['serving_size'] = serving_match.group(1)
                 
@@ -199,7 +223,7 @@ class FoodProductExtractor(BaseExtractor):
             text = element.get_text(strip=True)
             
             # Look for ingredient list format: "Ingredients: X, Y, Z"
-            ingredients_match = re.search(r'ingredients[:\s]+([^\.]+)', text, re.IGNORECASE)
+            ingredients_match = INGREDIENTS_RE.search(text)
             if ingredients_match:
                 ingredients_text = ingredients_match.group(1)
                 # Split by comma and clean up
@@ -220,11 +244,11 @@ class FoodProductExtractor(BaseExtractor):
             text = element.get_text(strip=True)
             
             # Look for contains/may contain statements
-            contains_match = re.search(r'contains[:\s]+([^\.]+)', text, re.IGNORECASE)
+            contains_match = CONTAINS_RE.search(text)
             if contains_match:
                 result['contains'] = contains_match.group(1)
                 
-            may_contain_match = re.search(r'may contain[:\s]+([^\.]+)', text, re.IGNORECASE)
+            may_contain_match = MAY_CONTAIN_RE.search(text)
             if may_contain_match:
                 result['may_contain'] = may_contain_match.group(1)
                 
@@ -276,8 +300,7 @@ class FoodProductExtractor(BaseExtractor):
             text = element.get_text(strip=True)
             
             # Look for country of origin
-            origin_match = re.search(r'(country of origin|made in|produce of|product of)[:\s]+([^\.]+)', 
-                                    text, re.IGNORECASE)
+            origin_match = ORIGIN_RE.search(text)
             if origin_match:
                 result['country_of_origin'] = origin_match.group(2).strip()
                 break
@@ -325,16 +348,18 @@ class FrozenCannedExtractor(FoodProductExtractor):
             text = element.get_text(strip=True)
             
             # Look for temperature specifications
-            temp_match = re.search(r'([<>]?[\-\d]+[\s]*[°℃CFcf])', text)
+            temp_match = TEMPERATURE_RE.search(text)
             if temp_match:
                 result['temperature_specification'] = temp_match.group(1)
                 
+            text_lower = text.lower()
+            
             # Look for monitoring requirements
-            if 'monitor' in text.lower():
+            if 'monitor' in text_lower:
                 result['monitoring_required'] = True
                 
             # Look for "do not refreeze" warnings
-            if 'do not refreeze' in text.lower():
+            if 'do not refreeze' in text_lower:
                 result['do_not_refreeze'] = True
                 
         return result
@@ -418,13 +443,12 @@ class ProcessedFoodExtractor(FoodProductExtractor):
             text = element.get_text(strip=True)
             
             # Look for E-numbers (EU food additives)
-            e_numbers = re.findall(r'E[ -]?\d{3,4}[a-z]?', text)
+            e_numbers = E_NUMBER_RE.findall(text)
             if e_numbers:
                 additives_list.extend(e_numbers)
                 
             # Look for additive names
-            additive_names = re.findall(r'(sodium benzoate|potassium sorbate|citric acid|aspartame|MSG)', 
-                                      text, re.IGNORECASE)
+            additive_names = ADDITIVE_NAME_RE.findall(text)
             if additive_names:
                 additives_list.extend([name.lower() for name in additive_names])
                 
@@ -450,13 +474,8 @@ class ProcessedFoodExtractor(FoodProductExtractor):
             text = element.get_text(strip=True)
             
             # Look for common health claims
-            for claim_pattern in [
-                r'(good source of|high in) ([^\.]+)',
-                r'(low|reduced|no|free from) ([^\.]+)',
-                r'(whole grain|natural ingredients|no artificial) ([^\.]*)',
-                r'(helps|supports|maintains|improves) ([^\.]+)'
-            ]:
-                matches = re.findall(claim_pattern, text, re.IGNORECASE)
+            for claim_re in HEALTH_CLAIM_RES:
+                matches = claim_re.findall(text)
                 for match in matches:
                     claims.append(' '.join(match).strip())
                     
@@ -506,12 +525,12 @@ class BeverageExtractor(FoodProductExtractor):
             text = element.get_text(strip=True)
             
             # Look for alcohol percentage
-            abv_match = re.search(r'(\d+(\.\d+)?)\s*%\s*(ABV|alcohol|vol)', text, re.IGNORECASE)
+            abv_match = ABV_RE.search(text)
             if abv_match:
                 result['abv_percentage'] = abv_match.group(1)
                 
             # Look for alcohol warnings
-            if re.search(r'not (suitable|recommended) for (children|pregnant)', text, re.IGNORECASE):
+            if ALCOHOL_WARNING_RE.search(text):
                 result['warning_present'] = True
                 
         return result
@@ -532,12 +551,12 @@ class BeverageExtractor(FoodProductExtractor):
             text = element.get_text(strip=True)
             
             # Look for caffeine amount
-            caffeine_match = re.search(r'(\d+(\.\d+)?)\s*(mg|milligrams)(\s+of)?\s+caffeine', text, re.IGNORECASE)
+            caffeine_match = CAFFEINE_RE.search(text)
             if caffeine_match:
                 result['caffeine_mg'] = caffeine_match.group(1)
                 
             # Look for high caffeine warnings
-            high_match = re.search(r'high\s+caffeine\s+content', text, re.IGNORECASE)
+            high_match = HIGH_CAFFEINE_RE.search(text)
             if high_match:
                 result['high_caffeine_warning'] = True
                 
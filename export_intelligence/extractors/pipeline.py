@@ -9,9 +9,10 @@ import re
 import json
 import logging
 import hashlib
+from collections import OrderedDict
 from datetime import datetime
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Comment
 
 from export_intelligence.extractors.base import BaseExtractor
 from export_intelligence.extractors.adaptive import AdaptiveExtractor
@@ -20,6 +21,32 @@ from export_intelligence.extractors.food import get_food_industry_patterns
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Price cleanup: strip everything but digits and separators in one pass
+NON_PRICE_CHARS_RE = re.compile(r'[^\d.,]')
+
+# Default number of processing results kept for already-seen documents
+PROCESSED_DOCUMENTS_LIMIT = 1000
+
+# Runs of whitespace collapsed by the whitespace preprocessor
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Numeric part of a temperature such as "0°F" or "-4.5 °F"
+TEMPERATURE_VALUE_RE = re.compile(r'-?[\d.]+')
+
+# Fields that must be present for each document type
+REQUIRED_FIELDS = {
+    'product': ('product_name',),
+    'competitor': ('company_name',),
+    'customer': ('company_name',)
+}
+
+# Document type -> (ExtractionPipeline method preparing the record, StorageManager method storing it)
+PERSIST_METHODS = {
+    'product': ('_prepare_product_data', 'store_product'),
+    'competitor': ('_prepare_competitor_data', 'store_competitor'),
+    'customer': ('_prepare_customer_data', 'store_customer')
+}
+
 
 class ExtractionPipeline:
     """
@@ -40,7 +67,10 @@ class ExtractionPipeline:
         self.preprocessors = []
         self.validators = []
         self.transformers = []
-        self.processed_documents = {}
+        # Most recent results by document ID, oldest evicted first, so a
+        # long-running pipeline doesn't hold every document it has seen
+        self.processed_documents = OrderedDict()
+        self.processed_documents_limit = self.config.get('processed_documents_limit', PROCESSED_DOCUMENTS_LIMIT)
         
         # Initialize default extractors
         self._setup_default_extractors()
@@ -116,6 +146,7 @@ class ExtractionPipeline:
         # Check if we've already processed this document
         if document_id in self.processed_documents:
             logger.info(f"Document already processed: {document_id}")
+            self.processed_documents.move_to_end(document_id)
             return self.processed_documents[document_id]
         
         # Store basic document info
@@ -148,6 +179,8 @@ class ExtractionPipeline:
             
             # Store processing result
             self.processed_documents[document_id] = result
+            if len(self.processed_documents) > self.processed_documents_limit:
+                self.processed_documents.popitem(last=False)
             
             # Persist to storage if available
             if self.storage_manager and document_type:
@@ -289,28 +322,16 @@ class ExtractionPipeline:
             result: Processing result dictionary
             document_type: Type of document
         """
+        methods = PERSIST_METHODS.get(document_type)
+        if methods is None:
+            logger.warning(f"Unknown document type for storage: {document_type}")
+            return
+        prepare_method, store_method = methods
+        
         try:
-            if document_type == 'product':
-                # Store product data
-                product_data = self._prepare_product_data(result)
-                if product_data:
-                    self.storage_manager.store_product(product_data)
-                    
-            elif document_type == 'competitor':
-                # Store competitor data
-                competitor_data = self._prepare_competitor_data(result)
-                if competitor_data:
-                    self.storage_manager.store_competitor(competitor_data)
-                    
-            elif document_type == 'customer':
-                # Store customer data
-                customer_data = self._prepare_customer_data(result)
-                if customer_data:
-                    self.storage_manager.store_customer(customer_data)
-                    
-            else:
-                logger.warning(f"Unknown document type for storage: {document_type}")
-                
+            data = getattr(self, prepare_method)(result)
+            if data:
+                getattr(self.storage_manager, store_method)(data)
         except Exception as e:
             logger.error(f"Error persisting results: {str(e)}")
     
@@ -387,16 +408,17 @@ class ExtractionPipeline:
             return None
             
         # Clean and extract numeric value
-        price_str = re.sub(r'[^\d.,]', '', price_str)
+        price_str = NON_PRICE_CHARS_RE.sub('', price_str)
         
         try:
             # Handle different decimal separators
-            if ',' in price_str and '.' in price_str:
-                # Format like 1,234.56
-                price_str = price_str.replace(',', '')
-            elif ',' in price_str:
-                # Format like 1,23 (European)
-                price_str = price_str.replace(',', '.')
+            if ',' in price_str:
+                if '.' in price_str:
+                    # Format like 1,234.56
+                    price_str = price_str.replace(',', '')
+                else:
+                    # Format like 1,23 (European)
+                    price_str = price_str.replace(',', '.')
                 
             return float(price_str)
         except ValueError:
@@ -576,6 +598,23 @@ class HTMLFingerprinter:
 
 
 # Common preprocessors
+def _clean_soup(soup):
+    """Remove scripts, styles, and comments from a parsed document in place."""
+    for element in soup(["script", "style"]):
+        element.decompose()
+        
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+
+
+def _normalize_soup_whitespace(soup):
+    """Collapse whitespace in the text nodes of a parsed document in place."""
+    for text in soup.find_all(text=True):
+        if text.parent.name not in ['script', 'style', 'pre', 'code']:
+            new_text = WHITESPACE_RE.sub(' ', text.string.strip())
+            text.replace_with(new_text)
+
+
 def clean_html_preprocessor(html):
     """
     Clean HTML content by removing scripts, styles, and comments.
@@ -587,15 +626,7 @@ def clean_html_preprocessor(html):
         Cleaned HTML
     """
     soup = BeautifulSoup(html, 'html.parser')
-    
-    # Remove scripts, styles, and comments
-    for element in soup(["script", "style"]):
-        element.decompose()
-        
-    # Remove comments
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        comment.extract()
-        
+    _clean_soup(soup)
     return str(soup)
 
 
@@ -610,12 +641,27 @@ def normalize_whitespace_preprocessor(html):
         HTML with normalized whitespace
     """
     soup = BeautifulSoup(html, 'html.parser')
+    _normalize_soup_whitespace(soup)
+    return str(soup)
+
+
+def clean_and_normalize_preprocessor(html):
+    """
+    Clean HTML and normalize its whitespace in a single parse.
     
-    for text in soup.find_all(text=True):
-        if text.parent.name not in ['script', 'style', 'pre', 'code']:
-            new_text = re.sub(r'\s+', ' ', text.string.strip())
-            text.replace_with(new_text)
-            
+    Equivalent to clean_html_preprocessor followed by
+    normalize_whitespace_preprocessor, without parsing and serializing
+    the document twice.
+    
+    Args:
+        html: HTML content
+        
+    Returns:
+        Cleaned HTML with normalized whitespace
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    _clean_soup(soup)
+    _normalize_soup_whitespace(soup)
     return str(soup)
 
 
@@ -638,15 +684,7 @@ def required_fields_validator(data, context):
     }
     
     # Define required fields based on document type
-    required_fields = []
-    
-    document_type = context.get('document_type', '')
-    if document_type == 'product':
-        required_fields = ['product_name']
-    elif document_type == 'competitor':
-        required_fields = ['company_name']
-    elif document_type == 'customer':
-        required_fields = ['company_name']
+    required_fields = REQUIRED_FIELDS.get(context.get('document_type', ''), ())
         
     # Check for missing required fields
     missing_fields = []
@@ -688,7 +726,7 @@ def market_compliance_validator(data, context):
             # Check temperature specifications
             if 'shelf_life' in data and 'storage_temperature' in data['shelf_life']:
                 temp = data['shelf_life']['storage_temperature']
-                if not re.search(r'-18°C', temp):
+                if '-18°C' not in temp:
                     result['warnings'].append("UK requires frozen goods to be stored at ≤-18°C")
                     
         # Check allergen highlighting
@@ -712,7 +750,7 @@ def market_compliance_validator(data, context):
         # Check for Halal certification
         if 'certifications' in data:
             certifications = data['certifications'].get('certifications', [])
-            if 'halal' not in [c.lower() for c in certifications]:
+            if not any(c.lower() == 'halal' for c in certifications):
                 result['warnings'].append("UAE markets require Halal certification for many food products")
                 
         # Check for BPA-free labeling
@@ -757,7 +795,7 @@ def standardize_fields_transformer(data, validation_results, context):
         # Convert temperature to standard celsius format
         if '°F' in temp:
             try:
-                f_temp = float(re.search(r'-?[\d.]+', temp).group())
+                f_temp = float(TEMPERATURE_VALUE_RE.search(temp).group())
                 c_temp = round((f_temp - 32) * 5/9, 1)
                 transformed['shelf_life']['storage_temperature_c'] = f"{c_temp}°C"
             except:
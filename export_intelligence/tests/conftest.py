@@ -1,4 +1,5 @@
 import os
+import shutil
 import pytest
 import sqlite3
 import tempfile
@@ -60,10 +61,10 @@ def sample_html_product_page():
     </html>
     """
 
-@pytest.fixture
-def temp_db():
-    """Creates a temporary SQLite database for testing"""
-    fd, path = tempfile.mkstemp(suffix='.db')
+@pytest.fixture(scope="session")
+def temp_db_template(tmp_path_factory):
+    """Builds the sample database once per session for temp_db to copy"""
+    path = str(tmp_path_factory.mktemp('db') / 'template.db')
     conn = sqlite3.connect(path)
     cursor = conn.cursor()
     
@@ -99,8 +100,18 @@ def temp_db():
     
     conn.commit()
     conn.close()
+    
+    return path
+
+@pytest.fixture
+def temp_db(temp_db_template):
+    """Creates a temporary SQLite database for testing"""
+    fd, path = tempfile.mkstemp(suffix='.db')
     os.close(fd)
     
+    # Each test gets its own copy of the template schema
+    shutil.copyfile(temp_db_template, path)
+    
     yield path
     
     # Cleanup
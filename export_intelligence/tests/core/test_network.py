@@ -1,6 +1,7 @@
 """Tests for the network module."""
 
 import re
+import time
 import pytest
 import responses
 import unittest.mock as mock
@@ -8,6 +9,13 @@ from urllib.parse import urlparse
 
 from export_intelligence.core.network import NetworkManager, RateLimiter
 
+# robots.txt body shared by the tests whose crawls should never be blocked
+ALLOW_ALL_ROBOTS_TXT = "User-agent: *\nAllow: /"
+
+
+def _no_sleep(seconds):
+    """Stand-in for time.sleep where the test doesn't inspect the calls."""
+
 
 @pytest.fixture
 def network_manager(test_config):
@@ -35,7 +43,7 @@ class TestNetworkManager:
         responses.add(
             responses.GET,
             "https://example.com/robots.txt",
-            body="User-agent: *\nAllow: /",
+            body=ALLOW_ALL_ROBOTS_TXT,
             status=200,
             content_type="text/plain"
         )
@@ -46,7 +54,7 @@ class TestNetworkManager:
         assert result["success"] is True
         assert result["status_code"] == 200
         assert result["content_type"] == "html"
-        assert "<body>Test page</body>" in result["content"]
+        assert result["content"] == "<html><body>Test page</body></html>"
 
     @responses.activate
     def test_fetch_json(self, network_manager):
@@ -65,7 +73,7 @@ class TestNetworkManager:
         responses.add(
             responses.GET,
             "https://api.example.com/robots.txt",
-            body="User-agent: *\nAllow: /",
+            body=ALLOW_ALL_ROBOTS_TXT,
             status=200,
             content_type="text/plain"
         )
@@ -78,7 +86,7 @@ class TestNetworkManager:
         assert result["content_type"] == "json"
     
     @responses.activate
-    def test_fetch_failure(self, network_manager):
+    def test_fetch_failure(self, network_manager, monkeypatch):
         """Test failed fetch with retries."""
         # Setup mock response
         url = "https://example.com/not-found"
@@ -93,17 +101,17 @@ class TestNetworkManager:
         responses.add(
             responses.GET,
             "https://example.com/robots.txt",
-            body="User-agent: *\nAllow: /",
+            body=ALLOW_ALL_ROBOTS_TXT,
             status=200,
             content_type="text/plain"
         )
         
-        # Mock sleep to speed up test
-        with mock.patch('time.sleep'):
-            result = network_manager.fetch(url, retry_count=2)
+        # Skip the backoff sleeps to speed up test
+        monkeypatch.setattr(time, 'sleep', _no_sleep)
+        result = network_manager.fetch(url, retry_count=2)
         
         assert result["success"] is False
-        assert "Failed after" in result["error"]
+        assert result["error"] == "Failed after 2 attempts"
     
     @responses.activate
     def test_robots_txt_compliance(self, network_manager):
@@ -135,7 +143,7 @@ class TestNetworkManager:
         assert result["success"] is True
     
     @responses.activate
-    def test_rate_limiting(self, network_manager):
+    def test_rate_limiting(self, network_manager, monkeypatch):
         """Test rate limiting."""
         # Setup mock responses
         url = "https://example.com/rate-limited"
@@ -144,7 +152,7 @@ class TestNetworkManager:
         responses.add(
             responses.GET,
             "https://example.com/robots.txt",
-            body="User-agent: *\nAllow: /",
+            body=ALLOW_ALL_ROBOTS_TXT,
             status=200,
             content_type="text/plain"
         )
@@ -177,14 +185,14 @@ class TestNetworkManager:
             content_type="text/html"
         )
         
-        # Mock sleep to speed up test
-        with mock.patch('time.sleep'):
-            result1 = network_manager.fetch(url)
-            assert result1["success"] is True
-            
-            # This should get rate limited but eventually succeed due to retries
-            result2 = network_manager.fetch(url)
-            assert result2["success"] is False  # Rate limited request fails
+        # Skip the rate limit and backoff sleeps to speed up test
+        monkeypatch.setattr(time, 'sleep', _no_sleep)
+        result1 = network_manager.fetch(url)
+        assert result1["success"] is True
+        
+        # This should get rate limited but eventually succeed due to retries
+        result2 = network_manager.fetch(url)
+        assert result2["success"] is False  # Rate limited request fails
     
     @pytest.mark.asyncio
     @responses.activate
@@ -204,7 +212,7 @@ class TestNetworkManager:
         responses.add(
             responses.GET,
             "https://example.com/robots.txt",
-            body="User-agent: *\nAllow: /",
+            body=ALLOW_ALL_ROBOTS_TXT,
             status=200,
             content_type="text/plain"
         )
@@ -230,7 +238,7 @@ class TestNetworkManager:
             responses.add(
                 responses.GET,
                 f"https://{domain}/robots.txt",
-                body="User-agent: *\nAllow: /",
+                body=ALLOW_ALL_ROBOTS_TXT,
                 status=200,
                 content_type="text/plain"
             )
@@ -44,32 +44,36 @@ class TestStorageManager:
             for table in required_tables:
                 assert table in tables
     
-    def test_store_competitor(self, temp_db):
-        """Test storing a competitor."""
-        storage = StorageManager(temp_db)
-        
-        # Test data
-        competitor = {
+    @pytest.mark.parametrize("store_method,table,company", [
+        ('store_competitor', 'competitors', {
             'company_name': 'Test Competitor',
             'website': 'https://testcompetitor.example.com',
             'target_market': 'United States',
             'industry': 'food_processing'
-        }
+        }),
+        ('store_customer', 'customers', {
+            'company_name': 'Test Customer',
+            'website': 'https://testcustomer.example.com',
+            'target_market': 'United States',
+            'industry': 'retail',
+            'distributor_type': 'wholesaler'
+        }),
+    ])
+    def test_store_company(self, temp_db, store_method, table, company):
+        """Test storing a competitor or customer."""
+        storage = StorageManager(temp_db)
         
-        # Store the competitor
-        comp_id = storage.store_competitor(competitor)
-        assert comp_id is not None
+        # Store the company
+        company_id = getattr(storage, store_method)(company)
+        assert company_id is not None
         
-        # Check if competitor was stored correctly
+        # Check if every field was stored correctly
         with storage.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM competitors WHERE id = ?", (comp_id,))
+            cursor.execute(f"SELECT * FROM {table} WHERE id = ?", (company_id,))
             result = dict(cursor.fetchone())
             
-            assert result['company_name'] == competitor['company_name']
-            assert result['website'] == competitor['website']
-            assert result['target_market'] == competitor['target_market']
-            assert result['industry'] == competitor['industry']
+            assert {key: result[key] for key in company} == company
     
     def test_update_competitor(self, temp_db):
         """Test updating an existing competitor."""
@@ -107,33 +111,60 @@ class TestStorageManager:
             assert result['company_name'] == updated_competitor['company_name']
             assert result['target_market'] == updated_competitor['target_market']
     
-    def test_store_customer(self, temp_db):
-        """Test storing a customer."""
+    def test_update_customer(self, temp_db):
+        """Test updating an existing customer, including through a new manager."""
         storage = StorageManager(temp_db)
         
-        # Test data
         customer = {
             'company_name': 'Test Customer',
             'website': 'https://testcustomer.example.com',
-            'target_market': 'United States',
-            'industry': 'retail',
-            'distributor_type': 'wholesaler'
+            'target_market': 'United States'
         }
-        
-        # Store the customer
         cust_id = storage.store_customer(customer)
-        assert cust_id is not None
         
-        # Check if customer was stored correctly
+        # Same website again, via the cached id and via a fresh lookup
+        assert storage.store_customer(dict(customer, target_market='Canada')) == cust_id
+        other = StorageManager(temp_db, create_tables=False)
+        assert other.store_customer(dict(customer, company_name='Renamed Customer', target_market='Canada')) == cust_id
+        
         with storage.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM customers WHERE id = ?", (cust_id,))
-            result = dict(cursor.fetchone())
+            cursor.execute("SELECT * FROM customers")
+            rows = [dict(row) for row in cursor.fetchall()]
+            
+            assert len(rows) == 1
+            assert rows[0]['company_name'] == 'Renamed Customer'
+            assert rows[0]['target_market'] == 'Canada'
+    
+    def test_update_recreated_competitor(self, temp_db):
+        """Test that a cached id is not reused after the row is re-created elsewhere."""
+        storage = StorageManager(temp_db)
+        competitor = {
+            'company_name': 'Test Competitor',
+            'website': 'https://testcompetitor.example.com',
+            'target_market': 'United States'
+        }
+        old_id = storage.store_competitor(competitor)
+        
+        # Another manager deletes the row and stores the company again under a new id
+        other = StorageManager(temp_db, create_tables=False)
+        with other.get_connection() as conn:
+            conn.execute("DELETE FROM competitors WHERE id = ?", (old_id,))
+            conn.commit()
+        other.store_competitor({'company_name': 'Other', 'website': 'https://other.example.com'})
+        new_id = other.store_competitor(competitor)
+        assert new_id != old_id
+        
+        assert storage.store_competitor(dict(competitor, target_market='Canada')) == new_id
+        
+        with storage.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM competitors WHERE website = ?", (competitor['website'],))
+            rows = [dict(row) for row in cursor.fetchall()]
             
-            assert result['company_name'] == customer['company_name']
-            assert result['website'] == customer['website']
-            assert result['target_market'] == customer['target_market']
-            assert result['distributor_type'] == customer['distributor_type']
+            assert len(rows) == 1
+            assert rows[0]['id'] == new_id
+            assert rows[0]['target_market'] == 'Canada'
     
     def test_store_product(self, temp_db):
         """Test storing a product."""
@@ -200,8 +231,14 @@ class TestStorageManager:
             
             assert result[0] == 12.99
     
-    def test_get_competitors(self, temp_db):
-        """Test retrieving competitors."""
+    @pytest.mark.parametrize("filters,expected_count", [
+        ({}, 3),
+        ({'target_market': 'United States'}, 2),
+        ({'industry': 'food'}, 2),
+        ({'target_market': 'United States', 'industry': 'food'}, 1),
+    ], ids=['all', 'by_market', 'by_industry', 'by_market_and_industry'])
+    def test_get_competitors(self, temp_db, filters, expected_count):
+        """Test retrieving competitors with each combination of filters."""
         storage = StorageManager(temp_db)
         
         # Create multiple competitors
@@ -229,25 +266,9 @@ class TestStorageManager:
         for comp in competitors:
             storage.store_competitor(comp)
         
-        # Test retrieving all competitors
-        all_comps = storage.get_competitors()
-        assert len(all_comps) == 3
-        
-        # Test retrieving by target market
-        us_comps = storage.get_competitors(target_market='United States')
-        assert len(us_comps) == 2
-        assert all(comp['target_market'] == 'United States' for comp in us_comps)
-        
-        # Test retrieving by industry
-        food_comps = storage.get_competitors(industry='food')
-        assert len(food_comps) == 2
-        assert all(comp['industry'] == 'food' for comp in food_comps)
-        
-        # Test combining filters
-        us_food_comps = storage.get_competitors(target_market='United States', industry='food')
-        assert len(us_food_comps) == 1
-        assert us_food_comps[0]['target_market'] == 'United States'
-        assert us_food_comps[0]['industry'] == 'food'
+        comps = storage.get_competitors(**filters)
+        assert len(comps) == expected_count
+        assert all(comp[key] == value for comp in comps for key, value in filters.items())
     
     def test_get_product_stats(self, temp_db):
         """Test retrieving product statistics."""
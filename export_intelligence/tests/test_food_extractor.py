@@ -252,82 +252,101 @@ BEVERAGE_HTML = """
 """
 
 
-@pytest.fixture
+# The extractors only read from the soup, so each document is parsed once
+# per module rather than once per test.
+@pytest.fixture(scope="module")
 def frozen_product_soup():
     """Return a BeautifulSoup object for a frozen product."""
     return BeautifulSoup(FROZEN_PRODUCT_HTML, 'html.parser')
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def processed_food_soup():
     """Return a BeautifulSoup object for a processed food product."""
     return BeautifulSoup(PROCESSED_FOOD_HTML, 'html.parser')
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def beverage_soup():
     """Return a BeautifulSoup object for a beverage product."""
     return BeautifulSoup(BEVERAGE_HTML, 'html.parser')
 
 
+# _extract keeps no state between calls, so tests share one extractor each.
+@pytest.fixture(scope="module")
+def food_extractor():
+    """Return a FoodProductExtractor."""
+    return FoodProductExtractor()
+
+
+@pytest.fixture(scope="module")
+def frozen_canned_extractor():
+    """Return a FrozenCannedExtractor."""
+    return FrozenCannedExtractor()
+
+
+@pytest.fixture(scope="module")
+def processed_food_extractor():
+    """Return a ProcessedFoodExtractor."""
+    return ProcessedFoodExtractor()
+
+
+@pytest.fixture(scope="module")
+def beverage_extractor():
+    """Return a BeverageExtractor."""
+    return BeverageExtractor()
+
+
 class TestFoodProductExtractor:
     """Test the basic food product extractor."""
     
-    def test_extract_product_name(self, frozen_product_soup):
+    def test_extract_product_name(self, food_extractor, frozen_product_soup):
         """Test extraction of product name."""
-        extractor = FoodProductExtractor()
-        name = extractor._extract_product_name(frozen_product_soup)
+        name = food_extractor._extract_product_name(frozen_product_soup)
         assert name == "Frozen Garden Peas - Premium Quality"
     
-    def test_extract_description(self, frozen_product_soup):
+    def test_extract_description(self, food_extractor, frozen_product_soup):
         """Test extraction of product description."""
-        extractor = FoodProductExtractor()
-        description = extractor._extract_description(frozen_product_soup)
+        description = food_extractor._extract_description(frozen_product_soup)
         assert "Sweet and tender garden peas" in description
     
-    def test_extract_shelf_life(self, frozen_product_soup):
+    def test_extract_shelf_life(self, food_extractor, frozen_product_soup):
         """Test extraction of shelf life information."""
-        extractor = FoodProductExtractor()
-        shelf_life = extractor._extract_shelf_life(frozen_product_soup)
+        shelf_life = food_extractor._extract_shelf_life(frozen_product_soup)
         assert 'shelf_life' in shelf_life
         assert shelf_life['shelf_life']['storage_temperature'] == "-18°C"
         assert shelf_life['shelf_life']['shelf_life_duration'] == "24"
         assert shelf_life['shelf_life']['shelf_life_unit'] == "month"
     
-    def test_extract_nutritional_info(self, frozen_product_soup):
+    def test_extract_nutritional_info(self, food_extractor, frozen_product_soup):
         """Test extraction of nutritional information."""
-        extractor = FoodProductExtractor()
-        nutrition = extractor._extract_nutritional_info(frozen_product_soup)
+        nutrition = food_extractor._extract_nutritional_info(frozen_product_soup)
         assert 'nutrition' in nutrition
         assert nutrition['nutrition']['calories'] == "81 kcal (339 kJ)"
         assert nutrition['nutrition']['protein'] == "6.0g"
     
-    def test_extract_ingredients(self, frozen_product_soup):
+    def test_extract_ingredients(self, food_extractor, frozen_product_soup):
         """Test extraction of ingredients."""
-        extractor = FoodProductExtractor()
-        ingredients = extractor._extract_ingredients(frozen_product_soup)
+        ingredients = food_extractor._extract_ingredients(frozen_product_soup)
         assert 'ingredients' in ingredients
         assert "100% Garden Peas" in ingredients['ingredients']['ingredients_list']
     
-    def test_extract_allergens(self, frozen_product_soup):
+    def test_extract_allergens(self, food_extractor, frozen_product_soup):
         """Test extraction of allergen information."""
-        extractor = FoodProductExtractor()
-        allergens = extractor._extract_allergens(frozen_product_soup)
+        allergens = food_extractor._extract_allergens(frozen_product_soup)
         assert 'allergens' in allergens
         assert 'may_contain' in allergens['allergens']
         assert 'celery' in allergens['allergens']['emphasized_allergens']
     
-    def test_extract_certifications(self, frozen_product_soup):
+    def test_extract_certifications(self, food_extractor, frozen_product_soup):
         """Test extraction of certification information."""
-        extractor = FoodProductExtractor()
-        certifications = extractor._extract_certifications(frozen_product_soup)
+        certifications = food_extractor._extract_certifications(frozen_product_soup)
         assert 'certifications' in certifications
         assert 'organic' in certifications['certifications']['certifications']
     
-    def test_extract_origin(self, frozen_product_soup):
+    def test_extract_origin(self, food_extractor, frozen_product_soup):
         """Test extraction of origin information."""
-        extractor = FoodProductExtractor()
-        origin = extractor._extract_origin(frozen_product_soup)
+        origin = food_extractor._extract_origin(frozen_product_soup)
         assert 'origin' in origin
         assert origin['origin']['country_of_origin'] == "United Kingdom"
 
@@ -335,24 +354,21 @@ class TestFoodProductExtractor:
 class TestFrozenCannedExtractor:
     """Test the frozen/canned goods extractor."""
     
-    def test_extract_cold_chain_info(self, frozen_product_soup):
+    def test_extract_cold_chain_info(self, frozen_canned_extractor, frozen_product_soup):
         """Test extraction of cold chain information."""
-        extractor = FrozenCannedExtractor()
-        cold_chain = extractor._extract_cold_chain_info(frozen_product_soup)
+        cold_chain = frozen_canned_extractor._extract_cold_chain_info(frozen_product_soup)
         assert cold_chain['temperature_specification'] == "-18°C"
         assert cold_chain['do_not_refreeze'] == True
     
-    def test_extract_packaging_info(self, frozen_product_soup):
+    def test_extract_packaging_info(self, frozen_canned_extractor, frozen_product_soup):
         """Test extraction of packaging information."""
-        extractor = FrozenCannedExtractor()
-        packaging = extractor._extract_packaging_info(frozen_product_soup)
+        packaging = frozen_canned_extractor._extract_packaging_info(frozen_product_soup)
         assert packaging['type'] == "plastic"
         assert packaging['recyclable'] == True
     
-    def test_full_extraction(self, frozen_product_soup):
+    def test_full_extraction(self, frozen_canned_extractor, frozen_product_soup):
         """Test full extraction of a frozen product."""
-        extractor = FrozenCannedExtractor()
-        data = extractor._extract(frozen_product_soup, "http://example.com/frozen-peas")
+        data = frozen_canned_extractor._extract(frozen_product_soup, "http://example.com/frozen-peas")
         assert data['product_name'] == "Frozen Garden Peas - Premium Quality"
         assert 'shelf_life' in data
         assert 'nutrition' in data
@@ -365,25 +381,23 @@ class TestFrozenCannedExtractor:
 class TestProcessedFoodExtractor:
     """Test the processed food extractor."""
     
-    def test_extract_additives(self, processed_food_soup):
+    def test_extract_additives(self, processed_food_extractor, processed_food_soup):
         """Test extraction of additives information."""
-        extractor = ProcessedFoodExtractor()
-        additives = extractor._extract_additives(processed_food_soup)
+        additives = processed_food_extractor._extract_additives(processed_food_soup)
         assert 'identified_additives' in additives
         assert 'e330' in [a.lower() for a in additives['identified_additives']]
     
-    def test_extract_health_claims(self, processed_food_soup):
+    def test_extract_health_claims(self, processed_food_extractor, processed_food_soup):
         """Test extraction of health claims."""
-        extractor = ProcessedFoodExtractor()
-        claims = extractor._extract_health_claims(processed_food_soup)
+        claims = processed_food_extractor._extract_health_claims(processed_food_soup)
         assert 'claims' in claims
-        assert any('good source of vitamin c' in claim.lower() for claim in claims['claims'])
-        assert any('no added sugar' in claim.lower() for claim in claims['claims'])
+        claims_lower = [claim.lower() for claim in claims['claims']]
+        assert any('good source of vitamin c' in claim for claim in claims_lower)
+        assert any('no added sugar' in claim for claim in claims_lower)
     
-    def test_full_extraction(self, processed_food_soup):
+    def test_full_extraction(self, processed_food_extractor, processed_food_soup):
         """Test full extraction of a processed food product."""
-        extractor = ProcessedFoodExtractor()
-        data = extractor._extract(processed_food_soup, "http://example.com/tomato-sauce")
+        data = processed_food_extractor._extract(processed_food_soup, "http://example.com/tomato-sauce")
         assert data['product_name'] == "Organic Tomato Pasta Sauce"
         assert 'additives' in data
         assert 'health_claims' in data
@@ -395,17 +409,15 @@ class TestProcessedFoodExtractor:
 class TestBeverageExtractor:
     """Test the beverage extractor."""
     
-    def test_extract_alcohol_content(self, beverage_soup):
+    def test_extract_alcohol_content(self, beverage_extractor, beverage_soup):
         """Test extraction of alcohol content."""
-        extractor = BeverageExtractor()
-        alcohol = extractor._extract_alcohol_content(beverage_soup)
+        alcohol = beverage_extractor._extract_alcohol_content(beverage_soup)
         assert alcohol['abv_percentage'] == "13.5"
         assert alcohol['warning_present'] == True
     
-    def test_full_extraction(self, beverage_soup):
+    def test_full_extraction(self, beverage_extractor, beverage_soup):
         """Test full extraction of a beverage product."""
-        extractor = BeverageExtractor()
-        data = extractor._extract(beverage_soup, "http://example.com/red-wine")
+        data = beverage_extractor._extract(beverage_soup, "http://example.com/red-wine")
         assert data['product_name'] == "Premium Organic Red Wine"
         assert 'alcohol' in data
         assert data['alcohol']['abv_percentage'] == "13.5"
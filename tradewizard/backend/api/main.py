@@ -1,5 +1,6 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from api.assessment import router as assessment_router
 
 app = FastAPI(title="TradeWizard API")
@@ -16,6 +17,15 @@ app.add_middleware(
 # Include routers
 app.include_router(assessment_router)
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """
+    Turn errors the routes don't handle into a 500 response.
+    Routes raise HTTPException for expected errors, which FastAPI answers
+    with its own status code before this handler is reached.
+    """
+    return JSONResponse(status_code=500, content={"detail": str(exc)})
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to the TradeWizard API"} 
\ No newline at end of file
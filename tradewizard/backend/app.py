@@ -1,14 +1,16 @@
 #!/usr/bin/env python
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
-import json
 import logging
+import orjson
 import os
 import sys
-import importlib
 from datetime import datetime
-import traceback
-import requests
+from urllib.parse import urlsplit, urlunsplit
+import asyncio
+import threading
+import time
+import aiohttp
 
 # Add the project root to the path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -75,8 +77,20 @@ print("Initializing AssessmentFlowService...")
 assessment_flow_service = AssessmentFlowService()
 print("AssessmentFlowService initialized successfully")
 
-from services.market_intelligence import MarketIntelligenceService
-market_intelligence_service = MarketIntelligenceService()
+# Reuse the assessment flow's instance, so both share one set of market data
+# caches instead of loading the market data twice
+market_intelligence_service = assessment_flow_service.market_intelligence
+
+from services.llm_service import get_llm_service, create_http_session, JSON_HEADERS
+llm_service = get_llm_service()
+
+# The export-guru MCP server (port 3000 is the frontend's dev server), and a
+# keep-alive session for forwarding requests to it
+MCP_SERVER_URL = 'http://localhost:3001'
+mcp_session = create_http_session()
+
+# Load the model in the background so the first user turn doesn't pay for it
+threading.Thread(target=llm_service.warmup, name="llm-warmup", daemon=True).start()
 
 # Register blueprints
 app.register_blueprint(user_bp, url_prefix='/api/user')
@@ -190,8 +204,7 @@ def get_initial_question():
             "question": question
         })
     except Exception as e:
-        app.logger.error(f"Error getting initial question: {str(e)}")
-        app.logger.error(traceback.format_exc())
+        app.logger.exception("Error getting initial question")
         return jsonify({
             "success": False,
             "error": str(e)
@@ -229,31 +242,25 @@ def process_response():
         result = assessment_flow_service.process_response(step_id, user_response, user_data)
         
         # Ensure we always have the basic structure to prevent frontend errors
-        if 'user_data' not in result:
-            result['user_data'] = {}
+        result.setdefault('user_data', {})
             
         # Ensure next_step is a string or has required properties
-        if 'next_step' in result and isinstance(result['next_step'], dict):
-            if 'id' not in result['next_step']:
-                result['next_step']['id'] = 'unknown'
-            if 'prompt' not in result['next_step']:
-                result['next_step']['prompt'] = ''
+        next_step = result.get('next_step')
+        if isinstance(next_step, dict):
+            next_step.setdefault('id', 'unknown')
+            next_step.setdefault('prompt', '')
                 
         # Add a response field if missing
         if 'response' not in result:
-            if 'next_step' in result and isinstance(result['next_step'], dict):
-                result['response'] = result['next_step'].get('prompt', '')
-            else:
-                result['response'] = ''
+            result['response'] = next_step['prompt'] if isinstance(next_step, dict) else ''
         
-        print(f"Returning result: {json.dumps(result, indent=2)[:200]}...")
+        logger.debug("Returning result for step %s: next_step=%s", step_id, result.get('next_step'))
         response = jsonify(result)
         # Add explicit CORS headers
         response.headers.add('Access-Control-Allow-Origin', '*')
         return response
     except Exception as e:
-        logger.error(f"Error processing response: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error processing response")
         error_response = jsonify({
             "error": str(e),
             "user_data": {},
@@ -313,11 +320,29 @@ def send_message():
         
         return jsonify(response), 200
     except Exception as e:
-        import traceback
-        print(f"Error processing message: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error processing message")
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/chat/stream', methods=['POST'])
+def stream_chat_message():
+    """Stream an LLM reply to the client as server-sent events"""
+    data = request.json or {}
+    message = data.get('message')
+    
+    if not message:
+        return jsonify({"error": "Missing required fields"}), 400
+    
+    def events():
+        try:
+            for token in llm_service.stream_chat(message, data.get('system_prompt')):
+                yield f"data: {orjson.dumps({'token': token}).decode()}\n\n"
+            yield "event: done\ndata: {}\n\n"
+        except Exception as e:
+            logger.exception("Error streaming LLM response")
+            yield f"event: error\ndata: {orjson.dumps({'error': str(e)}).decode()}\n\n"
+    
+    return Response(stream_with_context(events()), mimetype='text/event-stream')
+
 @app.route('/api/chat/history/<chat_id>', methods=['GET'])
 def get_chat_history(chat_id):
     """Get the conversation history for a chat session"""
@@ -327,6 +352,50 @@ def get_chat_history(chat_id):
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+# Downstream services probed by the health check endpoint. The LLM probe
+# lists the models on the same host LLMService generates against.
+HEALTH_PROBES = {
+    "llm": urlunsplit(urlsplit(llm_service.api_url)[:2] + ('/api/tags', '', '')),
+    "mcp": f"{MCP_SERVER_URL}/health"
+}
+
+async def _probe_service(session, url):
+    """Probe a single downstream service and return its status string."""
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=2)) as response:
+            return "ok" if response.status < 400 else f"error (HTTP {response.status})"
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return f"unavailable ({e.__class__.__name__})"
+
+async def _probe_services():
+    """Probe all downstream services concurrently, so the check costs as long as the slowest probe."""
+    async with aiohttp.ClientSession() as session:
+        results = await asyncio.gather(
+            *(_probe_service(session, url) for url in HEALTH_PROBES.values())
+        )
+    return dict(zip(HEALTH_PROBES, results))
+
+# Probe results are reused for a few seconds, so frequent liveness checks
+# don't turn into a stream of requests against the LLM and MCP servers
+HEALTH_CACHE_TTL = 5  # seconds
+_health_cache = (0.0, None)  # (monotonic time of the probe, results)
+_health_cache_lock = threading.Lock()
+
+def _cached_probe_services():
+    """
+    Return recent probe results, probing again once they are older than HEALTH_CACHE_TTL.
+    Only a stale cache starts an event loop; fresh results are returned synchronously.
+    The lock makes concurrent requests on a stale cache wait for one probe
+    instead of each running their own.
+    """
+    global _health_cache
+    with _health_cache_lock:
+        probed_at, services = _health_cache
+        if services is None or time.monotonic() - probed_at >= HEALTH_CACHE_TTL:
+            services = asyncio.run(_probe_services())
+            _health_cache = (time.monotonic(), services)
+        return services
+
 @app.route('/api/health', methods=['GET', 'OPTIONS'])
 def health_check():
     """Health check endpoint"""
@@ -341,14 +410,16 @@ def health_check():
         # Check if assessment service is ready
         assessment_status = "ok" if assessment_flow_service else "not initialized"
         
+        # Probe the LLM and MCP servers
+        services = {"assessment": assessment_status}
+        services.update(_cached_probe_services())
+        
         # Log the health check
-        print(f"Health check requested and returning status: ok")
+        print(f"Health check requested and returning status: ok, services: {services}")
         
         response = jsonify({
             "status": "ok",
-            "services": {
-                "assessment": assessment_status
-            },
+            "services": services,
             "timestamp": datetime.now().isoformat()
         })
         
@@ -491,9 +562,8 @@ def export_readiness_report_endpoint():
                 }
                 
                 reports.append(report)
-            except Exception as e:
-                logger.error(f"Error processing market {market}: {str(e)}")
-                logger.error(traceback.format_exc())
+            except Exception:
+                logger.exception("Error processing market %s", market)
         
         # Return either a single report or multiple reports based on the request
         if len(reports) == 1 and single_market:
@@ -508,8 +578,7 @@ def export_readiness_report_endpoint():
             })
     
     except Exception as e:
-        logger.error(f"Error generating export readiness report: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error generating export readiness report")
         return jsonify({"error": f"Failed to generate report: {str(e)}"}), 500
 
 @app.route('/api/market/options', methods=['POST', 'OPTIONS'])
@@ -547,13 +616,13 @@ def market_options_endpoint():
             app.logger.debug(f"Including industry in request: {data['industry']}")
         
         # Forward the request to the MCP server through the proxy
-        response = requests.post(
-            'http://localhost:3000/api/mcp/tools',
+        response = mcp_session.post(
+            f'{MCP_SERVER_URL}/api/mcp/tools',
             json={
                 'tool': 'getMarketOptions',
                 'params': params
             },
-            headers={'Content-Type': 'application/json'}
+            headers=JSON_HEADERS
         )
         
         # Check if the response is successful
@@ -564,23 +633,27 @@ def market_options_endpoint():
                 "error": f"MCP server returned error: {response.status_code}"
             }), response.status_code
         
-        # Get the markets from the response
-        markets_data = response.json()
+        # With selected markets the MCP server's body is returned unchanged,
+        # so relay it as-is rather than decoding and re-encoding it
+        if selected_markets:
+            return Response(response.content, status=response.status_code,
+                            mimetype='application/json')
         
-        # If no selected markets are provided, filter to only include USA, UK, and UAE
-        if not selected_markets:
-            default_markets = ['USA', 'UK', 'UAE']
-            if 'markets' in markets_data:
-                markets_data['markets'] = [
-                    market for market in markets_data['markets'] 
-                    if market['id'] in default_markets
-                ]
+        # Get the markets from the response
+        markets_data = orjson.loads(response.content)
+        
+        # No selected markets were provided, so filter to only include USA, UK, and UAE
+        default_markets = ['USA', 'UK', 'UAE']
+        if 'markets' in markets_data:
+            markets_data['markets'] = [
+                market for market in markets_data['markets']
+                if market['id'] in default_markets
+            ]
         
         # Return the markets
         return jsonify(markets_data)
     except Exception as e:
-        app.logger.error(f"Error getting market options: {str(e)}")
-        app.logger.error(traceback.format_exc())
+        app.logger.exception("Error getting market options")
         return jsonify({
             "success": False,
             "error": str(e)
@@ -594,11 +667,9 @@ def proxy_mcp_tools():
     avoiding CORS issues and providing a single point of entry.
     """
     try:
-        # Log the request
-        app.logger.debug(f"Proxying MCP tools request: {request.json}")
-        
         # Get the request data
         data = request.json
+        app.logger.debug("Proxying MCP tools request: %s", data)
         
         # Only add industry information if not present and if we have business context
         # This allows the frontend to explicitly set the industry when it knows it
@@ -610,11 +681,11 @@ def proxy_mcp_tools():
                            f"The AI Agent should determine the appropriate industry.")
         
         # Forward the request to the MCP server
-        mcp_url = 'http://localhost:3001/api/mcp/tools'
-        response = requests.post(
+        mcp_url = f'{MCP_SERVER_URL}/api/mcp/tools'
+        response = mcp_session.post(
             mcp_url,
             json=data,
-            headers={'Content-Type': 'application/json'}
+            headers=JSON_HEADERS
         )
         
         # Check if the response is successful
@@ -625,11 +696,12 @@ def proxy_mcp_tools():
                 "error": f"MCP server returned error: {response.status_code}"
             }), response.status_code
         
-        # Return the response from the MCP server
-        return jsonify(response.json()), response.status_code
+        # Relay the MCP server's JSON body as-is rather than decoding and
+        # re-encoding it
+        return Response(response.content, status=response.status_code,
+                        mimetype='application/json')
     except Exception as e:
-        app.logger.error(f"Error proxying to MCP server: {str(e)}")
-        app.logger.error(traceback.format_exc())
+        app.logger.exception("Error proxying to MCP server")
         return jsonify({
             "success": False,
             "error": f"Failed to communicate with MCP server: {str(e)}"
@@ -9,10 +9,110 @@ import time
 import os
 import re
 import bs4
+from datetime import datetime
 from urllib.parse import urlparse
 from typing import Dict, Any, List, Optional
 import traceback
 
+# Patterns used while walking page elements, compiled once at import
+ISO_RE = re.compile(r'iso\s+\d+')
+HACCP_RE = re.compile(r'haccp(?:\s+level\s+\d+)?', re.IGNORECASE)
+FSSC_RE = re.compile(r'fssc\s+\d+', re.IGNORECASE)
+
+FOUNDED_PATTERNS = (
+    re.compile(r'(?:founded|established|since|est\.?)\s+in\s+(\d{4})', re.IGNORECASE),
+    re.compile(r'(?:founded|established|since|est\.?)[:\s]+(\d{4})', re.IGNORECASE),
+    re.compile(r'since\s+(\d{4})', re.IGNORECASE)
+)
+TEAM_LINK_RE = re.compile(r'team|about us|our people', re.IGNORECASE)
+
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+PHONE_RE = re.compile(r'(?:\+\d{1,3}[ -]?)?(?:\(\d{1,4}\)|\d{1,4})[ -]?\d{1,4}[ -]?\d{1,4}[ -]?\d{1,4}')
+# One pass per link; the named group that matched is the platform
+SOCIAL_PLATFORM_RE = re.compile(
+    r'(?P<facebook>facebook\.com)|(?P<twitter>twitter\.com|x\.com)|(?P<instagram>instagram\.com)'
+    r'|(?P<linkedin>linkedin\.com)|(?P<youtube>youtube\.com)'
+)
+
+ROLE_RE = re.compile(r'(CEO|CFO|COO|Director|Manager|Head of|Lead)\b.*', re.IGNORECASE)
+LOCATION_RE = re.compile(r'(?:located|facility|factory|based) in (\w+(?:[ -]\w+)*)', re.IGNORECASE)
+
+# The current year, re-read from the clock at most once an hour
+_CURRENT_YEAR = [datetime.now().year, time.monotonic()]
+CURRENT_YEAR_REFRESH = 3600  # seconds
+
+def _current_year() -> int:
+    """Return the current year without querying the clock on every call."""
+    now = time.monotonic()
+    if now - _CURRENT_YEAR[1] > CURRENT_YEAR_REFRESH:
+        _CURRENT_YEAR[:] = [datetime.now().year, now]
+    return _CURRENT_YEAR[0]
+
+def _keyword_re(*keywords: str) -> re.Pattern:
+    """Compile keywords into one case-insensitive substring alternation."""
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+def _all_keywords_re(*keywords: str) -> re.Pattern:
+    """
+    Compile keywords for finding every one that occurs in lowercased text in a single scan.
+    
+    The lookahead lets matches overlap ('south africa' also yields 'africa'), so
+    findall() gives the same keywords as testing each one with `in`, as long as
+    no two keywords start with the same text.
+    """
+    return re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+
+# Keyword checks run on every matching element, one regex scan each
+MARKET_CONTEXT_RE = _keyword_re('operate', 'market', 'sell', 'distribut', 'export', 'presence')
+CERT_TERMS_RE = _keyword_re(
+    'iso', 'haccp', 'fssc', 'certified', 'certification', 'standard',
+    'sabs', 'halal', 'kosher', 'organic', 'fair trade'
+)
+# Other certifications matched by name: (lowercased search term, display name)
+OTHER_CERTIFICATIONS = tuple(
+    (cert.lower(), cert) for cert in ('Halal', 'Kosher', 'Organic', 'Fair Trade', 'SABS')
+)
+SIZE_INDICATORS = (
+    ('small', _keyword_re('small business', 'family owned', 'family-owned', 'family business')),
+    ('medium', _keyword_re('medium-sized', 'medium sized', 'growing business')),
+    ('large', _keyword_re('large', 'corporation', 'international', 'global presence'))
+)
+ADDRESS_KEYWORDS_RE = _keyword_re('address', 'location', 'find us', 'visit us')
+TEAM_SECTION_RE = _keyword_re('team', 'leadership', 'management', 'our people', 'about us', 'who we are')
+ROLE_KEYWORDS_RE = _keyword_re('ceo', 'cfo', 'coo', 'director', 'manager', 'head', 'leader')
+FACILITY_KEYWORDS_RE = _keyword_re('facility', 'facilities', 'factory', 'plant', 'production', 'manufacturing')
+FEATURE_KEYWORDS_RE = _keyword_re('equipment', 'technology', 'machine', 'capacity', 'production line', 'processing')
+DIST_KEYWORDS_RE = _keyword_re('distribution', 'where to buy', 'find our products', 'retailers', 'stores')
+# Retailers and online platforms mentioned in distribution sections
+RETAILER_NAMES = ('woolworths', 'spar', 'pick n pay', 'checkers', 'shoprite', 'makro',
+                  'walmart', 'tesco', 'sainsbury', 'aldi', 'lidl', 'carrefour', 'waitrose')
+ONLINE_PLATFORMS = ('website', 'online store', 'e-commerce', 'takealot', 'amazon', 'ebay', 'etsy', 'shopify')
+RETAILER_RE = _keyword_re(*RETAILER_NAMES)
+ONLINE_PLATFORM_RE = _keyword_re(*ONLINE_PLATFORMS)
+RETAILER_NAMES_RE = _all_keywords_re(*RETAILER_NAMES)
+ONLINE_PLATFORMS_RE = _all_keywords_re(*ONLINE_PLATFORMS)
+EXPORT_KEYWORDS_RE = _keyword_re('export', 'international', 'global market', 'overseas')
+SUSTAIN_KEYWORDS_RE = _keyword_re(
+    'sustainability', 'sustainable', 'environment', 'green', 'eco',
+    'responsible', 'ethical', 'fair trade', 'organic'
+)
+INITIATIVE_KEYWORDS_RE = _keyword_re(
+    'packaging', 'waste', 'energy', 'water', 'carbon', 'community',
+    'recycling', 'renewable', 'footprint'
+)
+SUSTAIN_CERT_KEYWORDS_RE = _keyword_re('certified', 'certification', 'organic', 'fair trade', 'rainforest alliance')
+
+# Countries or regions mentioned in paragraphs, and the market each one maps to
+MARKET_INDICATORS = {
+    'south africa': 'South Africa', 'namibia': 'Namibia', 'botswana': 'Botswana',
+    'zimbabwe': 'Zimbabwe', 'mozambique': 'Mozambique', 'zambia': 'Zambia',
+    'angola': 'Angola', 'swaziland': 'Swaziland', 'lesotho': 'Lesotho',
+    'africa': 'Africa', 'global': 'Global', 'international': 'Global',
+    'worldwide': 'Global', 'europe': 'United Kingdom', 'asia': 'Asia',
+    'americas': 'Americas'
+}
+MARKET_INDICATORS_RE = _all_keywords_re(*MARKET_INDICATORS)
+
 class BsScraper:
     """BeautifulSoup-based web scraper for company websites"""
     
@@ -50,10 +150,7 @@ class BsScraper:
     def extract_domain(self, url: str) -> str:
         """Extract domain from URL"""
         parsed_url = urlparse(url)
-        domain = parsed_url.netloc
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        return domain
+        return parsed_url.netloc.removeprefix('www.')
     
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """Fetch a webpage and return a BeautifulSoup object"""
@@ -137,9 +234,9 @@ class BsScraper:
         if soup.title:
             title = soup.title.text.strip()
             # Clean up title (often has suffix like "| Home")
-            title_parts = title.split('|')
-            if len(title_parts) > 1:
-                return title_parts[0].strip()
+            name, separator, _ = title.partition('|')
+            if separator:
+                return name.strip()
             
             # Try to extract from title without pipe
             possible_name = title.strip()
@@ -157,7 +254,7 @@ class BsScraper:
             return logo['alt'].strip()
         
         # Fall back to domain name
-        return domain.split('.')[0].title()
+        return domain.partition('.')[0].title()
     
     def _extract_description(self, soup: BeautifulSoup) -> str:
         """Extract company description"""
@@ -257,33 +354,12 @@ class BsScraper:
         """Extract current markets"""
         markets = []
         
-        # Look for text mentioning countries or regions
-        country_indicators = [
-            'south africa', 'namibia', 'botswana', 'zimbabwe', 'mozambique',
-            'zambia', 'angola', 'swaziland', 'lesotho', 'africa', 'global',
-            'international', 'worldwide', 'europe', 'asia', 'americas'
-        ]
-        
-        # Search for these indicators in paragraphs
+        # Look for paragraphs mentioning countries or regions in the context
+        # of operations/sales
         for p in soup.find_all('p'):
             text = p.text.lower()
-            for country in country_indicators:
-                if country in text:
-                    # Check if its mentioned in context of operations/sales
-                    context_indicators = ['operate', 'market', 'sell', 'distribut', 'export', 'presence']
-                    if any(indicator in text for indicator in context_indicators):
-                        if country == 'africa':
-                            markets.append('Africa')
-                        elif country == 'europe':
-                            markets.append('United Kingdom')
-                        elif country == 'asia':
-                            markets.append('Asia')
-                        elif country == 'americas':
-                            markets.append('Americas')
-                        elif country == 'global' or country == 'worldwide' or country == 'international':
-                            markets.append('Global')
-                        else:
-                            markets.append(country.title())
+            if MARKET_CONTEXT_RE.search(text):
+                markets.extend(MARKET_INDICATORS[country] for country in MARKET_INDICATORS_RE.findall(text))
         
         # Default to South Africa if no markets found
         if not markets:
@@ -295,40 +371,34 @@ class BsScraper:
         """Extract certifications"""
         certifications = []
         
-        # Common certification terms
-        cert_terms = [
-            'iso', 'haccp', 'fssc', 'certified', 'certification', 'standard',
-            'sabs', 'halal', 'kosher', 'organic', 'fair trade'
-        ]
-        
         # Look for certification mentions
         for p in soup.find_all(['p', 'li', 'div']):
             text = p.text.lower()
             
             # Look for common certification patterns
-            if any(term in text for term in cert_terms):
+            if CERT_TERMS_RE.search(text):
                 # Try to extract the specific certification
                 # ISO pattern (e.g., ISO 9001, ISO 14001)
-                iso_match = re.search(r'iso\s+\d+', text)
+                iso_match = ISO_RE.search(text)
                 if iso_match:
                     certifications.append(iso_match.group(0).upper())
                 
                 # HACCP pattern
                 if 'haccp' in text:
-                    haccp_match = re.search(r'haccp(?:\s+level\s+\d+)?', text, re.IGNORECASE)
+                    haccp_match = HACCP_RE.search(text)
                     if haccp_match:
                         certifications.append(haccp_match.group(0).upper())
                     else:
                         certifications.append('HACCP')
                 
                 # FSSC pattern (e.g., FSSC 22000)
-                fssc_match = re.search(r'fssc\s+\d+', text, re.IGNORECASE)
+                fssc_match = FSSC_RE.search(text)
                 if fssc_match:
                     certifications.append(fssc_match.group(0).upper())
                 
                 # Other common certifications
-                for cert in ['Halal', 'Kosher', 'Organic', 'Fair Trade', 'SABS']:
-                    if cert.lower() in text:
+                for cert_lower, cert in OTHER_CERTIFICATIONS:
+                    if cert_lower in text:
                         certifications.append(cert)
         
         # Remove duplicates and return the list of certifications
@@ -343,20 +413,13 @@ class BsScraper:
         }
         
         # Try to find founding year
-        founded_patterns = [
-            r'(?:founded|established|since|est\.?)\s+in\s+(\d{4})',
-            r'(?:founded|established|since|est\.?)[:\s]+(\d{4})',
-            r'since\s+(\d{4})'
-        ]
-        
         for p in soup.find_all('p'):
             text = p.text.lower()
-            for pattern in founded_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for pattern in FOUNDED_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     founded_year = int(match.group(1))
-                    current_year = 2024  # Hardcoded current year
-                    years_operating = current_year - founded_year
+                    years_operating = _current_year() - founded_year
                     
                     if years_operating < 5:
                         details["years_operating"] = "< 5 years"
@@ -369,22 +432,16 @@ class BsScraper:
                     break
         
         # Try to estimate size
-        size_indicators = {
-            'small': ['small business', 'family owned', 'family-owned', 'family business'],
-            'medium': ['medium-sized', 'medium sized', 'growing business'],
-            'large': ['large', 'corporation', 'international', 'global presence']
-        }
-        
         for p in soup.find_all('p'):
-            text = p.text.lower()
-            for size, indicators in size_indicators.items():
-                if any(indicator in text for indicator in indicators):
+            text = p.text
+            for size, indicators in SIZE_INDICATORS:
+                if indicators.search(text):
                     details["estimated_size"] = size.title()
                     details["confidence"] = 0.7
                     break
         
         # Check for team/about page for size estimation
-        team_page = soup.find('a', text=re.compile(r'team|about us|our people', re.IGNORECASE))
+        team_page = soup.find('a', text=TEAM_LINK_RE)
         if team_page and team_page.has_attr('href'):
             details["estimated_size"] = "Medium"  # Default assumption
             details["confidence"] = 0.6
@@ -401,23 +458,29 @@ class BsScraper:
             "confidence": 0.5
         }
         
-        # Extract email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        # Find email addresses and phone numbers in one pass over the text tags
         emails = []
+        phones = []
         
-        # Find emails in text
         for tag in soup.find_all(['p', 'div', 'span', 'a']):
-            if tag.name == 'a' and tag.get('href', '').startswith('mailto:'):
-                email = tag.get('href').replace('mailto:', '').strip()
-                if re.match(email_pattern, email):
+            href = tag.get('href', '') if tag.name == 'a' else ''
+            text = tag.text
+            
+            if href.startswith('mailto:'):
+                email = href.removeprefix('mailto:').strip()
+                if EMAIL_RE.match(email):
                     emails.append(email)
             else:
-                matches = re.findall(email_pattern, tag.text)
-                emails.extend(matches)
+                emails.extend(EMAIL_RE.findall(text))
+            
+            if href.startswith('tel:'):
+                phones.append(href.removeprefix('tel:').strip())
+            else:
+                phones.extend(PHONE_RE.findall(text))
         
         # Filter out non-company emails
-        domain_name = domain.split('.')[0]
-        company_emails = [email for email in emails if domain_name.lower() in email.lower()]
+        domain_name = domain.partition('.')[0].lower()
+        company_emails = [email for email in emails if domain_name in email.lower()]
         
         if company_emails:
             contact_info["email"] = company_emails[0]
@@ -425,29 +488,15 @@ class BsScraper:
         elif emails:
             contact_info["email"] = emails[0]
         
-        # Extract phone numbers
-        phone_pattern = r'(?:\+\d{1,3}[ -]?)?(?:\(\d{1,4}\)|\d{1,4})[ -]?\d{1,4}[ -]?\d{1,4}[ -]?\d{1,4}'
-        phones = []
-        
-        for tag in soup.find_all(['p', 'div', 'span', 'a']):
-            if tag.name == 'a' and tag.get('href', '').startswith('tel:'):
-                phone = tag.get('href').replace('tel:', '').strip()
-                phones.append(phone)
-            else:
-                matches = re.findall(phone_pattern, tag.text)
-                phones.extend(matches)
-        
         if phones:
             contact_info["phone"] = phones[0]
             contact_info["confidence"] = 0.8
         
         # Extract addresses
-        address_keywords = ['address', 'location', 'find us', 'visit us']
         address_texts = []
         
         for tag in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'p', 'div']):
-            tag_text = tag.text.lower()
-            if any(keyword in tag_text for keyword in address_keywords):
+            if ADDRESS_KEYWORDS_RE.search(tag.text):
                 # Get the next sibling or the parent's next sibling
                 siblings = list(tag.next_siblings)
                 if siblings and isinstance(siblings[0], (bs4.element.Tag)):
@@ -458,21 +507,12 @@ class BsScraper:
                         address_texts.append(next_parent_sibling.text.strip())
         
         # Check for social media links
-        social_platforms = {
-            'facebook': r'facebook\.com',
-            'twitter': r'twitter\.com|x\.com',
-            'instagram': r'instagram\.com',
-            'linkedin': r'linkedin\.com',
-            'youtube': r'youtube\.com'
-        }
-        
         social_media = []
         for link in soup.find_all('a', href=True):
             href = link['href'].lower()
-            for platform, pattern in social_platforms.items():
-                if re.search(pattern, href):
-                    social_media.append(platform)
-                    break
+            match = SOCIAL_PLATFORM_RE.search(href)
+            if match:
+                social_media.append(match.lastgroup)
         
         if social_media:
             contact_info["social_media"] = list(set(social_media))
@@ -492,11 +532,10 @@ class BsScraper:
         }
         
         # Look for team sections
-        team_section_keywords = ['team', 'leadership', 'management', 'our people', 'about us', 'who we are']
         team_sections = []
         
         for heading in soup.find_all(['h1', 'h2', 'h3']):
-            if any(keyword in heading.text.lower() for keyword in team_section_keywords):
+            if TEAM_SECTION_RE.search(heading.text):
                 # Get the section after this heading
                 section = []
                 for sibling in heading.next_siblings:
@@ -531,12 +570,11 @@ class BsScraper:
                         if role_elem and role_elem != name_elem:
                             role = role_elem.text.strip()
                             # Clean up role (often contains title or position)
-                            role_keywords = ['ceo', 'cfo', 'coo', 'director', 'manager', 'head', 'leader']
-                            if any(keyword in role.lower() for keyword in role_keywords):
+                            if ROLE_KEYWORDS_RE.search(role):
                                 role = role.strip()
                             else:
                                 # Try to extract just the role part
-                                role_match = re.search(r'(CEO|CFO|COO|Director|Manager|Head of|Lead)\b.*', role, re.IGNORECASE)
+                                role_match = ROLE_RE.search(role)
                                 if role_match:
                                     role = role_match.group(0).strip()
                         
@@ -560,38 +598,25 @@ class BsScraper:
         }
         
         # Look for facility-related keywords
-        facility_keywords = ['facility', 'facilities', 'factory', 'plant', 'production', 'manufacturing']
         facility_sections = []
         
         for heading in soup.find_all(['h1', 'h2', 'h3', 'h4']):
-            if any(keyword in heading.text.lower() for keyword in facility_keywords):
+            if FACILITY_KEYWORDS_RE.search(heading.text):
                 # Get the parent section
                 parent = heading.parent
                 if parent:
                     facility_sections.append(parent)
         
         # Extract locations from address information or facility mentions
-        location_patterns = [
-            r'located in (\w+(?:[ -]\w+)*)',
-            r'facility in (\w+(?:[ -]\w+)*)',
-            r'factory in (\w+(?:[ -]\w+)*)',
-            r'based in (\w+(?:[ -]\w+)*)'
-        ]
-        
         for section in facility_sections:
             section_text = section.text
             
             # Look for locations
-            for pattern in location_patterns:
-                matches = re.findall(pattern, section_text, re.IGNORECASE)
-                if matches:
-                    facilities_info["locations"].extend(matches)
+            facilities_info["locations"].extend(LOCATION_RE.findall(section_text))
             
             # Look for facility features
-            feature_keywords = ['equipment', 'technology', 'machine', 'capacity', 'production line', 'processing']
             for p in section.find_all('p'):
-                p_text = p.text.lower()
-                if any(keyword in p_text for keyword in feature_keywords):
+                if FEATURE_KEYWORDS_RE.search(p.text):
                     facilities_info["features"].append(p.text.strip())
         
         # If we found locations or features
@@ -614,52 +639,40 @@ class BsScraper:
         }
         
         # Look for distribution-related sections
-        dist_keywords = ['distribution', 'where to buy', 'find our products', 'retailers', 'stores']
         dist_sections = []
         
         for heading in soup.find_all(['h1', 'h2', 'h3', 'h4']):
-            if any(keyword in heading.text.lower() for keyword in dist_keywords):
+            if DIST_KEYWORDS_RE.search(heading.text):
                 # Get the parent section
                 parent = heading.parent
                 if parent:
                     dist_sections.append(parent)
         
-        # Look for retailer mentions
-        retailer_names = ['woolworths', 'spar', 'pick n pay', 'checkers', 'shoprite', 'makro', 
-                         'walmart', 'tesco', 'sainsbury', 'aldi', 'lidl', 'carrefour', 'waitrose']
-        
-        # Look for online platform mentions
-        online_platforms = ['website', 'online store', 'e-commerce', 'takealot', 'amazon', 'ebay', 'etsy', 'shopify']
-        
         for section in dist_sections:
             section_text = section.text.lower()
             
             # Check for retailers
-            for retailer in retailer_names:
-                if retailer in section_text:
-                    distribution_info["retail_locations"].append(retailer.title())
+            for retailer in RETAILER_NAMES_RE.findall(section_text):
+                distribution_info["retail_locations"].append(retailer.title())
             
             # Check for online platforms
-            for platform in online_platforms:
-                if platform in section_text:
-                    distribution_info["online_platforms"].append(platform.title())
+            for platform in ONLINE_PLATFORMS_RE.findall(section_text):
+                distribution_info["online_platforms"].append(platform.title())
             
             # Look for lists that might contain locations or stores
             for ul in section.find_all('ul'):
                 for li in ul.find_all('li'):
                     li_text = li.text.strip()
-                    if any(retailer in li_text.lower() for retailer in retailer_names):
+                    if RETAILER_RE.search(li_text):
                         distribution_info["retail_locations"].append(li_text)
-                    elif any(platform in li_text.lower() for platform in online_platforms):
+                    elif ONLINE_PLATFORM_RE.search(li_text):
                         distribution_info["online_platforms"].append(li_text)
         
         # Check for export markets
-        export_keywords = ['export', 'international', 'global market', 'overseas']
         export_sections = []
         
         for p in soup.find_all('p'):
-            p_text = p.text.lower()
-            if any(keyword in p_text for keyword in export_keywords):
+            if EXPORT_KEYWORDS_RE.search(p.text):
                 export_sections.append(p)
         
         # Common country names to look for
@@ -694,21 +707,15 @@ class BsScraper:
         }
         
         # Look for sustainability-related sections
-        sustain_keywords = ['sustainability', 'sustainable', 'environment', 'green', 'eco', 
-                           'responsible', 'ethical', 'fair trade', 'organic']
         sustain_sections = []
         
         for heading in soup.find_all(['h1', 'h2', 'h3', 'h4']):
-            if any(keyword in heading.text.lower() for keyword in sustain_keywords):
+            if SUSTAIN_KEYWORDS_RE.search(heading.text):
                 # Get the parent section
                 parent = heading.parent
                 if parent:
                     sustain_sections.append(parent)
         
-        # Initiative keywords
-        initiative_keywords = ['packaging', 'waste', 'energy', 'water', 'carbon', 'community', 
-                              'recycling', 'renewable', 'footprint']
-        
         # Look for initiatives within sustainability sections
         for section in sustain_sections:
             # Check for lists
@@ -718,15 +725,12 @@ class BsScraper:
             
             # Check paragraphs
             for p in section.find_all('p'):
-                p_text = p.text.lower()
-                if any(keyword in p_text for keyword in initiative_keywords):
+                if INITIATIVE_KEYWORDS_RE.search(p.text):
                     sustainability_info["initiatives"].append(p.text.strip())
             
             # Look for sustainability certifications
-            cert_keywords = ['certified', 'certification', 'organic', 'fair trade', 'rainforest alliance']
             for p in section.find_all(['p', 'li']):
-                p_text = p.text.lower()
-                if any(keyword in p_text for keyword in cert_keywords):
+                if SUSTAIN_CERT_KEYWORDS_RE.search(p.text):
                     potential_cert = p.text.strip()
                     # Avoid adding long paragraphs as certifications
                     if len(potential_cert.split()) < 10:
@@ -735,10 +739,9 @@ class BsScraper:
         # Check the entire page for sustainability mentions
         if not sustain_sections:
             for p in soup.find_all('p'):
-                p_text = p.text.lower()
-                if any(keyword in p_text for keyword in sustain_keywords):
-                    if any(initiative in p_text for initiative in initiative_keywords):
-                        sustainability_info["initiatives"].append(p.text.strip())
+                p_text = p.text
+                if SUSTAIN_KEYWORDS_RE.search(p_text) and INITIATIVE_KEYWORDS_RE.search(p_text):
+                    sustainability_info["initiatives"].append(p.text.strip())
         
         # Remove duplicates
         sustainability_info["initiatives"] = list(set(sustainability_info["initiatives"]))
@@ -1,12 +1,19 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache
+from collections import OrderedDict
+import threading
 import time
 import re
+import string
 import json
+import orjson
 import requests
-import os
 from urllib.parse import urlparse
 from tradewizard.backend.services.website_analyzer import WebsiteAnalyzerService
 from tradewizard.backend.services.market_intelligence import MarketIntelligenceService
+from tradewizard.backend.services.llm_service import (
+    RETRY_DELAY, create_http_session, extract_json_text, post_json, stream_json_response, try_parse_json_response
+)
 try:
     from tradewizard.backend.bs_scraper import BsScraper
 except ImportError:
@@ -38,6 +45,356 @@ import logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session for LLM API calls
+_SESSION = create_http_session()
+
+# Define the assessment flow - consolidated from both files.
+# Built once at import and shared by every AssessmentFlowService instance.
+ASSESSMENT_FLOW = {
+    # Sarah Introduction Flow - The 4-question sequence
+    'initial': {
+        'id': 'initial',
+        'prompt': "Hi there! I'm Sarah, your export readiness consultant at TradeWizard. To start your export journey, could you tell me your name, your role, and your business name?",
+        'next_step': "website",
+        'extraction_patterns': {
+            'first_name': r"(?:my name is|I'm|I am) ([A-Za-z]+)",
+            'last_name': r"(?:my last name is|surname is) ([A-Za-z]+)",
+            'role': r"(?:I am|I'm) (?:the|a|an)? ([A-Za-z\s]+) (?:at|of|for)",
+            'business_name': r"(?:business|company|organisation|organization) (?:is|called) ([A-Za-z0-9\s]+)"
+        },
+        'extraction_rules': {
+            'first_name': 'The person\'s first name',
+            'last_name': 'The person\'s last name if mentioned',
+            'role': 'Their role in the business',
+            'business_name': 'The complete business name'
+        },
+        'llm_role': {
+            'personality': 'Friendly, analytical export advisor named Sarah',
+            'goal': 'Extract and validate user information from their response',
+            'tone': 'Warm and professional',
+            'instructions': [
+                '1. Extract these required fields from the response:',
+                '   - First name',
+                '   - Last name',
+                '   - Role in the business',
+                '   - Complete business name',
+                '2. Return empty response if all fields are provided',
+                '3. Ask for missing information if any field is missing'
+            ]
+        }
+    },
+    'website': {
+        'id': 'website',
+        'prompt': "Great to meet you, {first_name}! Could you share your website so I can learn more about {business_name} while we chat?",
+        'next_step': "export_experience",
+        'extraction_patterns': {
+            'website_url': r"https?://[^\s]+"
+        },
+        'extraction_rules': {
+            'website_url': 'Any text that could be a website domain (e.g., example.com, www.example.co.za, http://example.com)'
+        },
+        'triggers': ["activate_website_analysis"],
+        'llm_role': {
+            'personality': 'Friendly, analytical export advisor named Sarah',
+            'goal': 'Extract and normalize website URL from response',
+            'tone': 'Warm and professional',
+            'instructions': [
+                '1. Extract any text that could be a website domain',
+                '2. Accept as valid if it contains at least one dot and a domain extension',
+                '3. Normalize the URL:',
+                '   - Add https:// if no protocol specified',
+                '   - Add www. if no subdomain specified',
+                '   - Convert to lowercase',
+                '4. Return empty response if valid domain is provided',
+                '5. Ask for a valid domain if none found'
+            ]
+        }
+    },
+    'export_experience': {
+        'id': 'export_experience',
+        'prompt': "While I'm reviewing your website, {first_name}, has {business_name} participated in any direct exports, and if so can you give some context to your export activities to date?",
+        'next_step': "export_motivation",
+        'extraction_patterns': {
+            'export_experience': r".*"  # Capture everything as the export experience
+        },
+        'extraction_rules': {
+            'export_experience': 'Any information about previous export activities or lack thereof'
+        },
+        'llm_role': {
+            'personality': 'Friendly, analytical export advisor named Sarah',
+            'goal': 'Extract information about previous export experience',
+            'tone': 'Warm and professional',
+            'instructions': [
+                '1. Extract any information about previous export activities',
+                '2. Note whether they have export experience or not',
+                '3. Return empty response if any information is provided',
+                '4. Ask for clarification only if no clear response is given'
+            ]
+        }
+    },
+    'export_motivation': {
+        'id': 'export_motivation',
+        'prompt': "While I'm reviewing your website, {first_name}, I'd love to hear why {business_name} is looking to export now? What's driving this decision?",
+        'next_step': "target_markets",
+        'extraction_patterns': {
+            'export_motivation': r".*"  # Capture everything as the motivation
+        },
+        'extraction_rules': {
+            'export_motivation': 'Any stated reason or motivation for wanting to export'
+        },
+        'llm_role': {
+            'personality': 'Friendly, analytical export advisor named Sarah',
+            'goal': 'Extract any motivation for exporting',
+            'tone': 'Warm and professional',
+            'instructions': [
+                '1. Extract any stated reason for wanting to export',
+                '2. Accept any motivation as valid (business growth, personal ambition, market testing, etc.)',
+                '3. Return empty response if any motivation is provided',
+                '4. Ask for clarification only if no clear motivation is given'
+            ]
+        }
+    },
+    'target_markets': {
+        'id': 'target_markets',
+        'prompt': "Based on your business profile, I've identified several potential markets for {business_name}. Which markets are you most interested in exploring?",
+        'next_step': "summary",
+        'type': 'market_selection',
+        'extraction_patterns': {
+            'selected_markets': r"([\w\s,]+)"
+        },
+        'extraction_rules': {
+            'selected_markets': 'The markets the user is interested in, as a comma-separated list'
+        },
+        'llm_role': {
+            'personality': 'Friendly, analytical export advisor named Sarah',
+            'goal': 'Extract the markets the user is interested in',
+            'tone': 'Warm and professional',
+            'instructions': [
+                '1. Extract the markets mentioned by the user',
+                '2. If no specific markets are mentioned, ask for clarification',
+                '3. Format the markets as a comma-separated list'
+            ]
+        }
+    },
+    'summary': {
+        'id': 'summary',
+        'prompt': "{first_paragraph}\n\n{certification_paragraph}\n\n{requirements_paragraph}\n\nWould you like to create an account to see your full export readiness report and get a step-by-step roadmap to your first international shipment?",
+        'type': "final",
+        'extraction_patterns': {},
+        'llm_role': {
+            'personality': 'Friendly, analytical export advisor named Sarah',
+            'goal': 'Summarize findings and encourage account creation',
+            'tone': 'Warm, professional, and enthusiastic',
+            'instructions': [
+                '1. Use the detected product information, certifications, and selected market',
+                '2. Personalize the message with the user\'s name and business name',
+                '3. Present a compelling summary of the initial assessment',
+            ]
+        },
+        'next_step': None  # End of the initial assessment flow
+    }
+}
+
+# Columnar views of the flow, so scans over a single attribute only touch one tuple
+STEP_IDS = tuple(ASSESSMENT_FLOW)
+STEP_TYPES = tuple(step.get('type', 'text') for step in ASSESSMENT_FLOW.values())
+
+# Step ID -> position in the flow. The ID set is closed (fixed at import), so this
+# table never changes after it is built.
+STEP_INDEX = {step_id: index for index, step_id in enumerate(STEP_IDS)}
+
+# Step type -> IDs of the steps of that type, in flow order
+STEPS_BY_TYPE = {
+    step_type: tuple(step_id for step_id, t in zip(STEP_IDS, STEP_TYPES) if t == step_type)
+    for step_type in dict.fromkeys(STEP_TYPES)
+}
+
+# Extraction patterns compiled once per step instead of on every user turn
+EXTRACTION_PATTERNS = {
+    step_id: {
+        key: re.compile(pattern, re.IGNORECASE)
+        for key, pattern in step.get('extraction_patterns', {}).items()
+    }
+    for step_id, step in ASSESSMENT_FLOW.items()
+}
+
+# Steps whose only extraction pattern is the catch-all ".*" -> the field it fills.
+# ".*" (without DOTALL) just captures the first line, so no regex is needed.
+CATCH_ALL_FIELDS = {
+    step_id: key
+    for step_id, step in ASSESSMENT_FLOW.items()
+    for key, pattern in step.get('extraction_patterns', {}).items()
+    if pattern == '.*' and len(step['extraction_patterns']) == 1
+}
+
+# Question templates, built once rather than on every call
+INITIAL_QUESTION_TEMPLATE = "While I'm reviewing your information, {user_name}, has {company_name} participated in any direct exports, and if so can you give some context to your export activities to date?"
+FOLLOW_UP_TEMPLATES = {
+    1: "I'd love to hear why {company_name} is looking to export now? What's driving this decision?",
+    2: "What products or services is {company_name} looking to export?",
+    3: "Which markets are you most interested in exploring for {company_name}?",
+    # Add more templates as needed
+}
+DEFAULT_FOLLOW_UP_TEMPLATE = "Can you tell me more about your export plans?"
+
+# Question placeholders -> (user_data key, default value)
+QUESTION_FIELDS = {
+    'user_name': ('name', 'there'),
+    'company_name': ('company', 'your company'),
+    'industry': ('industry', 'your industry')
+}
+
+@lru_cache(maxsize=256)
+def _compile_question_template(template: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Convert a question template to positional form, so formatting only looks
+    up the fields the template actually uses.
+    
+    Args:
+        template: Template with named placeholders such as {company_name}
+        
+    Returns:
+        The template with {0}, {1}, ... placeholders, and the field names in that order
+    """
+    parts = []
+    fields = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field is not None:
+            parts.append('{%d%s%s}' % (len(fields), '!' + conversion if conversion else '', ':' + spec if spec else ''))
+            fields.append(field)
+    return ''.join(parts), tuple(fields)
+
+@lru_cache(maxsize=1024)
+def _match_extraction_patterns(step_id: str, response: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Run a step's extraction patterns over a response.
+    Memoized, since the same text is re-processed on retries and clarifications.
+    
+    Args:
+        step_id: Step ID whose patterns to apply
+        response: User's response text
+        
+    Returns:
+        Immutable (key, value) pairs for the fields that matched
+    """
+    result = []
+    for key, pattern in EXTRACTION_PATTERNS.get(step_id, {}).items():
+        matches = pattern.findall(response)
+        if matches:
+            result.append((key, matches[0].strip()))
+    return tuple(result)
+
+@lru_cache(maxsize=1024)
+def _extract_domain(url: str) -> str:
+    """
+    Extract the lowercased domain, without www., from a URL.
+    Memoized, since the same website URL is resolved on every step of an assessment.
+    
+    Args:
+        url: Non-empty URL string, with or without a protocol
+        
+    Returns:
+        Domain name, or "" if the URL can't be parsed
+    """
+    # Add protocol if missing
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+        
+    try:
+        # Parse the URL
+        parsed_url = urlparse(url)
+        
+        # Extract domain, lowercased first so "WWW." is stripped too
+        domain = parsed_url.netloc.lower()
+        
+        # Remove www. prefix if present
+        return domain.removeprefix('www.')
+    except Exception as e:
+        print(f"Error extracting domain from URL '{url}': {e}")
+        return ""
+
+# Fallback patterns used by process_response on the initial step
+FIRST_NAME_RE = re.compile(r'[Mm]y name is ([A-Za-z]+)|[Ii]\'m ([A-Za-z]+)')
+BUSINESS_NAME_RE = re.compile(r'(?:at|to|for|with)\s+([A-Z][A-Za-z\s]+(?:Foods|Food|Ltd|LLC|Inc|Limited|Company|Co\.|SA))')
+# Sentences of a response, and the words after a sentence's first word;
+# used for the last-resort first name guess
+SENTENCE_RE = re.compile(r'[^.?!]+')
+LATER_WORDS_RE = re.compile(r'^\s*\S+\s+(.*)', re.DOTALL)
+NON_NAME_WORDS = frozenset({'i', 'my', 'the', 'a', 'an'})
+
+def _guess_first_name(response: str) -> Optional[str]:
+    """
+    Find the first capitalized word that's not at the beginning of a sentence.
+    
+    Args:
+        response: User's response text
+        
+    Returns:
+        The word, or None if there is no candidate
+    """
+    for sentence in SENTENCE_RE.finditer(response):
+        later = LATER_WORDS_RE.match(sentence.group())
+        if not later:
+            continue
+        for word in later.group(1).split():
+            if word[0].isupper() and len(word) > 1 and word.lower() not in NON_NAME_WORDS:
+                return word
+    return None
+
+# Fields the LLM is asked for when regex extraction of the initial reply falls short
+INITIAL_REQUIRED_FIELDS = {
+    'first_name': 'User first name',
+    'last_name': 'User last name (if provided)',
+    'role': 'User job role or position',
+    'business_name': 'Name of the business'
+}
+
+EXTRACTION_PROMPT_TEMPLATE = """
+        Extract the following information from the user's message:
+        User message: "{response}"
+        
+        Extract ONLY the following fields:
+        {field_lines}
+        
+        Format your response as a valid JSON object with these fields as keys.
+        If a field is not present in the user's message, use an empty string as the value.
+        IMPORTANT: Do not include any explanations or notes. Return ONLY the JSON object.
+        """
+
+# LLM extractions kept in memory, keyed by the exact user message and fields
+EXTRACTION_CACHE_SIZE = 256
+
+@lru_cache(maxsize=64)
+def _extraction_field_lines(fields: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Render the field list of the extraction prompt. Steps always ask for the
+    same fields, so each list is only rendered once.
+    
+    Args:
+        fields: (field name, description) pairs
+        
+    Returns:
+        One "- field: description" line per field
+    """
+    return "\n        ".join(f"- {field}: {description}" for field, description in fields)
+
+# Any letter in any script; a reply without one cannot contain a name
+HAS_LETTER_RE = re.compile(r'[^\W\d_]')
+
+# Prompt template placeholders, e.g. {first_name}
+PLACEHOLDER_RE = re.compile(r'\{([^}]+)\}')
+COMMON_PROMPT_FIELDS = frozenset({
+    'first_name', 'business_name', 'website_url', 'role', 'export_experience', 'export_motivation'
+})
+
+# Negative answers to the export experience question, matched in one scan.
+# Whole words only, so "Norway" or "know" are not read as a "no".
+NO_EXPORT_EXPERIENCE_RE = re.compile(r"\b(?:no|none|not|haven'?t)\b", re.IGNORECASE)
+
+# Demo domains (Global Fresh and test sites) that always use mock data
+DEMO_DOMAIN_RE = re.compile(r'globalfresh|freshglobal|^(?:example|test)\.com$', re.IGNORECASE)
+
 class AssessmentFlowService:
     """
     Service for handling the assessment flow logic.
@@ -57,197 +414,69 @@ class AssessmentFlowService:
         # Chat session storage
         self.chat_sessions: Dict[str, Dict] = {}
         
-        # Create chat data directory for persistence
-        os.makedirs("chat_data", exist_ok=True)
-        
-        # Define the assessment flow - consolidated from both files
-        self.assessment_flow = {
-            # Sarah Introduction Flow - The 4-question sequence
-            'initial': {
-                'id': 'initial',
-                'prompt': "Hi there! I'm Sarah, your export readiness consultant at TradeWizard. To start your export journey, could you tell me your name, your role, and your business name?",
-                'next_step': "website",
-                'extraction_patterns': {
-                    'first_name': r"(?:my name is|I'm|I am) ([A-Za-z]+)",
-                    'last_name': r"(?:my last name is|surname is) ([A-Za-z]+)",
-                    'role': r"(?:I am|I'm) (?:the|a|an)? ([A-Za-z\s]+) (?:at|of|for)",
-                    'business_name': r"(?:business|company|organisation|organization) (?:is|called) ([A-Za-z0-9\s]+)"
-                },
-                'extraction_rules': {
-                    'first_name': 'The person\'s first name',
-                    'last_name': 'The person\'s last name if mentioned',
-                    'role': 'Their role in the business',
-                    'business_name': 'The complete business name'
-                },
-                'llm_role': {
-                    'personality': 'Friendly, analytical export advisor named Sarah',
-                    'goal': 'Extract and validate user information from their response',
-                    'tone': 'Warm and professional',
-                    'instructions': [
-                        '1. Extract these required fields from the response:',
-                        '   - First name',
-                        '   - Last name',
-                        '   - Role in the business',
-                        '   - Complete business name',
-                        '2. Return empty response if all fields are provided',
-                        '3. Ask for missing information if any field is missing'
-                    ]
-                }
-            },
-            'website': {
-                'id': 'website',
-                'prompt': "Great to meet you, {first_name}! Could you share your website so I can learn more about {business_name} while we chat?",
-                'next_step': "export_experience",
-                'extraction_patterns': {
-                    'website_url': r"https?://[^\s]+"
-                },
-                'extraction_rules': {
-                    'website_url': 'Any text that could be a website domain (e.g., example.com, www.example.co.za, http://example.com)'
-                },
-                'triggers': ["activate_website_analysis"],
-                'llm_role': {
-                    'personality': 'Friendly, analytical export advisor named Sarah',
-                    'goal': 'Extract and normalize website URL from response',
-                    'tone': 'Warm and professional',
-                    'instructions': [
-                        '1. Extract any text that could be a website domain',
-                        '2. Accept as valid if it contains at least one dot and a domain extension',
-                        '3. Normalize the URL:',
-                        '   - Add https:// if no protocol specified',
-                        '   - Add www. if no subdomain specified',
-                        '   - Convert to lowercase',
-                        '4. Return empty response if valid domain is provided',
-                        '5. Ask for a valid domain if none found'
-                    ]
-                }
-            },
-            'export_experience': {
-                'id': 'export_experience',
-                'prompt': "While I'm reviewing your website, {first_name}, has {business_name} participated in any direct exports, and if so can you give some context to your export activities to date?",
-                'next_step': "export_motivation",
-                'extraction_patterns': {
-                    'export_experience': r".*"  # Capture everything as the export experience
-                },
-                'extraction_rules': {
-                    'export_experience': 'Any information about previous export activities or lack thereof'
-                },
-                'llm_role': {
-                    'personality': 'Friendly, analytical export advisor named Sarah',
-                    'goal': 'Extract information about previous export experience',
-                    'tone': 'Warm and professional',
-                    'instructions': [
-                        '1. Extract any information about previous export activities',
-                        '2. Note whether they have export experience or not',
-                        '3. Return empty response if any information is provided',
-                        '4. Ask for clarification only if no clear response is given'
-                    ]
-                }
-            },
-            'export_motivation': {
-                'id': 'export_motivation',
-                'prompt': "While I'm reviewing your website, {first_name}, I'd love to hear why {business_name} is looking to export now? What's driving this decision?",
-                'next_step': "target_markets",
-                'extraction_patterns': {
-                    'export_motivation': r".*"  # Capture everything as the motivation
-                },
-                'extraction_rules': {
-                    'export_motivation': 'Any stated reason or motivation for wanting to export'
-                },
-                'llm_role': {
-                    'personality': 'Friendly, analytical export advisor named Sarah',
-                    'goal': 'Extract any motivation for exporting',
-                    'tone': 'Warm and professional',
-                    'instructions': [
-                        '1. Extract any stated reason for wanting to export',
-                        '2. Accept any motivation as valid (business growth, personal ambition, market testing, etc.)',
-                        '3. Return empty response if any motivation is provided',
-                        '4. Ask for clarification only if no clear motivation is given'
-                    ]
-                }
-            },
-            'target_markets': {
-                'id': 'target_markets',
-                'prompt': "Based on your business profile, I've identified several potential markets for {business_name}. Which markets are you most interested in exploring?",
-                'next_step': "summary",
-                'type': 'market_selection',
-                'extraction_patterns': {
-                    'selected_markets': r"([\w\s,]+)"
-                },
-                'extraction_rules': {
-                    'selected_markets': 'The markets the user is interested in, as a comma-separated list'
-                },
-                'llm_role': {
-                    'personality': 'Friendly, analytical export advisor named Sarah',
-                    'goal': 'Extract the markets the user is interested in',
-                    'tone': 'Warm and professional',
-                    'instructions': [
-                        '1. Extract the markets mentioned by the user',
-                        '2. If no specific markets are mentioned, ask for clarification',
-                        '3. Format the markets as a comma-separated list'
-                    ]
-                }
-            },
-            'summary': {
-                'id': 'summary',
-                'prompt': "{first_paragraph}\n\n{certification_paragraph}\n\n{requirements_paragraph}\n\nWould you like to create an account to see your full export readiness report and get a step-by-step roadmap to your first international shipment?",
-                'type': "final",
-                'extraction_patterns': {},
-                'llm_role': {
-                    'personality': 'Friendly, analytical export advisor named Sarah',
-                    'goal': 'Summarize findings and encourage account creation',
-                    'tone': 'Warm, professional, and enthusiastic',
-                    'instructions': [
-                        '1. Use the detected product information, certifications, and selected market',
-                        '2. Personalize the message with the user\'s name and business name',
-                        '3. Present a compelling summary of the initial assessment',
-                    ]
-                },
-                'next_step': None  # End of the initial assessment flow
-            }
-        }
+        # LRU cache of LLM extractions, keyed by (user message, requested fields)
+        self._extraction_cache = OrderedDict()
+        self._extraction_cache_lock = threading.Lock()
+        
+        # Assessment flow definition (shared module-level table)
+        self.assessment_flow = ASSESSMENT_FLOW
+    
+    def get_steps_by_type(self, step_type: str) -> List[str]:
+        """
+        Get the IDs of all assessment steps of a given type.
+        
+        Args:
+            step_type: Step type (e.g. 'text', 'market_selection', 'final')
+            
+        Returns:
+            List of step IDs in flow order
+        """
+        return list(STEPS_BY_TYPE.get(step_type, ()))
+    
+    def get_step_index(self, step_id: str) -> int:
+        """
+        Get the position of a step in the assessment flow.
+        
+        Args:
+            step_id: Step ID
+            
+        Returns:
+            Zero-based position of the step, or -1 if the step is unknown
+        """
+        return STEP_INDEX.get(step_id, -1)
     
     def format_question(self, template, user_data):
         """
         Properly format a question template with user data.
         Ensures clean separation between template and user data.
         """
-        logger.debug(f"Question template: {template}")
-        logger.debug(f"User data: {user_data}")
-        
-        # Extract user data safely
-        user_name = user_data.get('name', 'there')
-        company_name = user_data.get('company', 'your company')
-        industry = user_data.get('industry', 'your industry')
-        
-        # Format the template with proper placeholders
-        formatted_question = template.format(
-            user_name=user_name,
-            company_name=company_name,
-            industry=industry
+        logger.debug("Question template: %s", template)
+        logger.debug("User data: %s", user_data)
+        
+        # Templates without placeholders are returned as-is
+        if '{' not in template:
+            return template
+        
+        # Look up only the fields the template uses, falling back to defaults
+        positional_template, fields = _compile_question_template(template)
+        formatted_question = positional_template.format(
+            *[user_data.get(*QUESTION_FIELDS[field]) for field in fields]
         )
         
-        logger.debug(f"Formatted question: {formatted_question}")
+        logger.debug("Formatted question: %s", formatted_question)
         return formatted_question
     
     def get_initial_question(self, user_data):
         """
         Get the initial assessment question.
         """
-        template = "While I'm reviewing your information, {user_name}, has {company_name} participated in any direct exports, and if so can you give some context to your export activities to date?"
-        return self.format_question(template, user_data)
+        return self.format_question(INITIAL_QUESTION_TEMPLATE, user_data)
     
     def get_follow_up_question(self, question_number, user_data):
         """
         Get a follow-up question based on the question number.
         """
-        templates = {
-            1: "I'd love to hear why {company_name} is looking to export now? What's driving this decision?",
-            2: "What products or services is {company_name} looking to export?",
-            3: "Which markets are you most interested in exploring for {company_name}?",
-            # Add more templates as needed
-        }
-        
-        template = templates.get(question_number, "Can you tell me more about your export plans?")
+        template = FOLLOW_UP_TEMPLATES.get(question_number, DEFAULT_FOLLOW_UP_TEMPLATE)
         return self.format_question(template, user_data)
     
     def extract_info_from_response(self, step_id: str, response: str) -> Dict[str, Any]:
@@ -270,8 +499,12 @@ class AssessmentFlowService:
             print(f"Warning: No step config found for step_id '{step_id}'")
             return {}
             
-        # Get extraction patterns
-        extraction_patterns = step_config.get('extraction_patterns', {})
+        # Fast paths: nothing to extract, or a single catch-all field
+        if not EXTRACTION_PATTERNS.get(step_id):
+            return {}
+        catch_all_key = CATCH_ALL_FIELDS.get(step_id)
+        if catch_all_key:
+            return {catch_all_key: response.partition('\n')[0].strip()}
         
         # Special handling for website step
         if step_id == 'website':
@@ -287,24 +520,21 @@ class AssessmentFlowService:
         
         # For the initial step, use more robust extraction with LLM
         if step_id == 'initial':
-            required_fields = {
-                'first_name': 'User first name',
-                'last_name': 'User last name (if provided)',
-                'role': 'User job role or position',
-                'business_name': 'Name of the business'
-            }
+            required_fields = INITIAL_REQUIRED_FIELDS
             
             # First try extraction with regex
-            result = {}
-            for key, pattern in extraction_patterns.items():
-                matches = re.findall(pattern, response, re.IGNORECASE)
-                if matches:
-                    result[key] = matches[0].strip()
+            result = dict(_match_extraction_patterns(step_id, response))
             
             # If we got all fields with regex, use those results
             if 'first_name' in result and 'business_name' in result:
                 print(f"[EXTRACT] Initial step regex extraction result: {result}")
                 return result
+            
+            # Nothing that could be a name (digits, punctuation, emoji only):
+            # the LLM can't extract anything either, so skip the round trip
+            if not HAS_LETTER_RE.search(response):
+                print("[EXTRACT] No names in initial response, skipping LLM extraction")
+                return result
                 
             # Fallback to LLM extraction if regex failed
             extracted_data = self._extract_with_llm(response, required_fields, step_id)
@@ -323,13 +553,7 @@ class AssessmentFlowService:
             return extracted_data
         
         # Use regex for simple pattern matching on other steps
-        result = {}
-        for key, pattern in extraction_patterns.items():
-            matches = re.findall(pattern, response, re.IGNORECASE)
-            if matches:
-                result[key] = matches[0].strip()
-                
-        return result
+        return dict(_match_extraction_patterns(step_id, response))
     
     def process_response(self, step_id: str, user_response: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process the user's response for a given step in the assessment flow."""
@@ -346,19 +570,17 @@ class AssessmentFlowService:
         # If this is the initial step, ensure we at least have a first name
         if step_id == 'initial' and (not extracted_info or 'first_name' not in extracted_info or not extracted_info.get('first_name')):
             # Try to extract a name with a simple pattern
-            name_match = re.search(r'[Mm]y name is ([A-Za-z]+)|[Ii]\'m ([A-Za-z]+)', user_response)
+            name_match = FIRST_NAME_RE.search(user_response)
             if name_match:
                 first_name = name_match.group(1) or name_match.group(2)
                 extracted_info['first_name'] = first_name
                 print(f"Extracted first name with simple pattern: {first_name}")
             else:
                 # As a last resort, use the first capitalized word that's not at the beginning of a sentence
-                words = user_response.split()
-                for i, word in enumerate(words):
-                    if (i > 0 and word[0].isupper() and word.lower() not in ['i', 'my', 'the', 'a', 'an'] and len(word) > 1):
-                        extracted_info['first_name'] = word
-                        print(f"Using capitalized word as first name: {word}")
-                        break
+                word = _guess_first_name(user_response)
+                if word:
+                    extracted_info['first_name'] = word
+                    print(f"Using capitalized word as first name: {word}")
                 
                 # If still no name, use 'User' as fallback
                 if 'first_name' not in extracted_info or not extracted_info['first_name']:
@@ -367,7 +589,7 @@ class AssessmentFlowService:
                     
         # Try to extract business name if not already present
         if step_id == 'initial' and (not extracted_info or 'business_name' not in extracted_info or not extracted_info.get('business_name')):
-            business_match = re.search(r'(?:at|to|for|with)\s+([A-Z][A-Za-z\s]+(?:Foods|Food|Ltd|LLC|Inc|Limited|Company|Co\.|SA))', user_response)
+            business_match = BUSINESS_NAME_RE.search(user_response)
             if business_match:
                 business_name = business_match.group(1).strip()
                 extracted_info['business_name'] = business_name
@@ -395,7 +617,7 @@ class AssessmentFlowService:
             user_data['website_url'] = website_url
             
             # Check if domain is Global Fresh or a test domain - ONLY these use mock data
-            if any(term in domain.lower() for term in ['globalfresh', 'freshglobal']) or domain.lower() in ['globalfreshsa.co.za', 'freshglobal.co.za', 'example.com', 'test.com']:
+            if self._is_demo_domain(domain):
                 user_data['use_mock_data'] = True
                 print(f"[WEBSITE] Using mock data for demo domain: {domain}")
             else:
@@ -410,8 +632,7 @@ class AssessmentFlowService:
                 print(f"[WEBSITE] Enforcing LLM-based analysis regardless of scraping success")
                 user_data['use_mock_data'] = False
             
-            # Trigger website analysis
-            self._trigger_website_analysis(user_data)
+            # Website analysis itself runs once, via this step's activate_website_analysis trigger
         
         # Get current step from assessment flow
         current_step = self.assessment_flow.get(step_id, {})
@@ -425,26 +646,18 @@ class AssessmentFlowService:
         
         # Check if next step should be the target markets selection
         if next_step_id == 'target_markets' or (step_id == 'export_motivation' and next_step_id):
-            # Get the next step
-            next_step = self.assessment_flow.get(next_step_id, {})
-            
             # Generate market options for the target_markets step
             market_options = self._generate_market_options(user_data)
             print(f"Generated {len(market_options)} market options for target_markets step")
             
-            # Generate contextual follow-up to transition to next step
-            contextual_followup = self._generate_contextual_followup(
+            contextual_followup, formatted_prompt = self._build_step_transition(
                 step_id, user_response, next_step_id, user_data)
             
-            # Format the contextual followup with user data
-            if contextual_followup:
-                contextual_followup = self._format_prompt(contextual_followup, user_data)
-            
             # Create a structured next_step object instead of just an ID
             response_data = {
                 'next_step': {
                     'id': next_step_id,
-                    'prompt': self._format_prompt(next_step.get('prompt', ''), user_data),
+                    'prompt': formatted_prompt,
                     'type': 'market_selection' if next_step_id == 'target_markets' else 'text',
                     'market_options': market_options if next_step_id == 'target_markets' else []
                 },
@@ -459,19 +672,8 @@ class AssessmentFlowService:
         
         # Format the next prompt or generate a summary if we've reached the end
         if next_step_id:
-            # Get the next step
-            next_step = self.assessment_flow.get(next_step_id, {})
-            
-            # Generate contextual follow-up to transition to next step
-            contextual_followup = self._generate_contextual_followup(
+            contextual_followup, formatted_prompt = self._build_step_transition(
                 step_id, user_response, next_step_id, user_data)
-            
-            # Format the contextual followup with user data
-            if contextual_followup:
-                contextual_followup = self._format_prompt(contextual_followup, user_data)
-                
-            # Create response data with a properly formatted prompt
-            formatted_prompt = self._format_prompt(next_step.get('prompt', ''), user_data)
             print(f"Formatted prompt: {formatted_prompt}")
             
             response_data = {
@@ -501,6 +703,32 @@ class AssessmentFlowService:
             print(f"Final user_data has {len(user_data)} keys: {list(user_data.keys())}")
             return response_data
     
+    def _build_step_transition(self, step_id: str, user_response: str, next_step_id: str,
+                               user_data: Dict[str, Any]) -> Tuple[Optional[str], str]:
+        """
+        Build the messages for moving from the current step to the next one.
+        
+        Args:
+            step_id: Current step ID
+            user_response: User's response text
+            next_step_id: Next step ID
+            user_data: Current user data
+            
+        Returns:
+            Tuple of (formatted contextual follow-up or None, formatted next step prompt)
+        """
+        next_step = self.assessment_flow.get(next_step_id, {})
+        
+        # Generate contextual follow-up to transition to next step
+        contextual_followup = self._generate_contextual_followup(
+            step_id, user_response, next_step_id, user_data)
+        
+        # Format the contextual followup with user data
+        if contextual_followup:
+            contextual_followup = self._format_prompt(contextual_followup, user_data)
+        
+        return contextual_followup, self._format_prompt(next_step.get('prompt', ''), user_data)
+    
     def _format_prompt(self, prompt_template: str, user_data: Dict[str, Any]) -> str:
         """
         Format a prompt template with user data.
@@ -512,13 +740,14 @@ class AssessmentFlowService:
         Returns:
             Formatted prompt
         """
+        # Most contextual follow-ups are already fully built strings
+        if '{' not in prompt_template:
+            return prompt_template
+        
         # If this is the summary step, use enhanced formatting
         if "{first_paragraph}" in prompt_template:
             return self._format_summary(prompt_template, user_data)
             
-        # Extract values from user data
-        formatted_prompt = prompt_template
-        
         # Helper function to get value, handling both string and dict values
         def get_value(key):
             value = user_data.get(key, '')
@@ -526,43 +755,25 @@ class AssessmentFlowService:
                 return value['text']
             return value or ''
         
-        # Replace common placeholders
-        placeholders = {
-            "{first_name}": get_value('first_name'),
-            "{business_name}": get_value('business_name'),
-            "{website_url}": get_value('website_url'),
-            "{role}": get_value('role'),
-            "{export_experience}": get_value('export_experience'),
-            "{export_motivation}": get_value('export_motivation'),
-        }
-        
-        # Replace all placeholders
-        for placeholder, value in placeholders.items():
-            if placeholder in formatted_prompt:
-                formatted_prompt = formatted_prompt.replace(placeholder, str(value))
-        
-        # Generic placeholder replacement for any other keys
-        for key, value in user_data.items():
-            placeholder = "{" + key + "}"
-            if placeholder in formatted_prompt and placeholder not in placeholders:
-                # Handle both string and dict values
+        def substitute(match):
+            key = match.group(1)
+            
+            # Common placeholders default to empty when missing
+            if key in COMMON_PROMPT_FIELDS:
+                return str(get_value(key))
+            
+            # Generic placeholder replacement for any other keys
+            if key in user_data:
+                value = user_data[key]
                 if isinstance(value, dict) and 'text' in value:
-                    formatted_prompt = formatted_prompt.replace(placeholder, value['text'])
-                elif isinstance(value, str):
-                    formatted_prompt = formatted_prompt.replace(placeholder, value)
-                else:
-                    # Convert other types to string
-                    formatted_prompt = formatted_prompt.replace(placeholder, str(value))
-        
-        # Get selected markets
-        selected_markets = user_data.get('selected_markets', 'the selected markets')
-        
-        # Replace any remaining placeholders with defaults
-        remaining_placeholders = re.findall(r'\{([^}]+)\}', formatted_prompt)
-        for placeholder in remaining_placeholders:
-            formatted_prompt = formatted_prompt.replace('{' + placeholder + '}', f"[{placeholder}]")
+                    return value['text']
+                return value if isinstance(value, str) else str(value)
             
-        return formatted_prompt
+            # Unknown placeholders are left visible as [name]
+            return f"[{key}]"
+        
+        # Replace every placeholder in a single pass over the template
+        return PLACEHOLDER_RE.sub(substitute, prompt_template)
     
     def _format_summary(self, prompt_template: str, user_data: Dict[str, Any]) -> str:
         """
@@ -645,7 +856,7 @@ class AssessmentFlowService:
         }
         
         # Get the first selected market for specific insight
-        first_market = selected_markets.split(',')[0].strip() if ',' in selected_markets else selected_markets
+        first_market = selected_markets.partition(',')[0].strip()
         market_insight = market_insights.get(first_market, "growing demand for premium food products")
         
         # Format the first paragraph
@@ -709,7 +920,7 @@ class AssessmentFlowService:
         # Check if it's a demo domain
         if 'website_url' in user_data:
             domain = self.extract_domain(user_data['website_url'])
-            is_demo_domain = any(term in domain.lower() for term in ['globalfresh', 'freshglobal']) or domain.lower() in ['globalfreshsa.co.za', 'freshglobal.co.za', 'example.com', 'test.com']
+            is_demo_domain = self._is_demo_domain(domain)
             
             if is_demo_domain:
                 use_mock_data = True
@@ -777,71 +988,59 @@ class AssessmentFlowService:
         Returns:
             Dictionary with extracted information and confidence scores
         """
-        # Create extraction prompt based on step
-        step_config = self.assessment_flow.get(step_id, {})
-        field_descriptions = step_config.get("extraction_rules", {})
+        # Messages that differ only in spacing or line breaks mean the same to
+        # the LLM, so normalize before prompting and share one cache entry.
+        # A resent message (retry, page refresh) reuses the earlier extraction.
+        response = ' '.join(response.split())
+        field_items = tuple(fields.items())
+        cache_key = (response, field_items)
+        with self._extraction_cache_lock:
+            cached = self._extraction_cache.get(cache_key)
+            if cached is not None:
+                self._extraction_cache.move_to_end(cache_key)
+                return dict(cached)
         
         # Build a more robustly structured prompt
-        extraction_prompt = f"""
-        Extract the following information from the user's message:
-        User message: "{response}"
-        
-        Extract ONLY the following fields:
-        """
-        
-        for field, description in fields.items():
-            extraction_prompt += f"\n- {field}: {description}"
-        
-        extraction_prompt += """
-        
-        Format your response as a valid JSON object with these fields as keys.
-        If a field is not present in the user's message, use an empty string as the value.
-        IMPORTANT: Do not include any explanations or notes. Return ONLY the JSON object.
-        """
+        extraction_prompt = EXTRACTION_PROMPT_TEMPLATE.format(
+            response=response,
+            field_lines=_extraction_field_lines(field_items)
+        )
         
         try:
             # Make LLM request
-            headers = {"Content-Type": "application/json"}
             data = {
                 "model": self.model,
-                "prompt": extraction_prompt,
-                "stream": False
+                "prompt": extraction_prompt
             }
             
             # Print the extraction prompt in debug mode
             if self.debug:
                 print(f"Extraction prompt: {extraction_prompt}")
                 
-            # Make request with retry logic
+            # Make request with retry logic. The response is streamed and
+            # reading stops once the JSON object is complete.
             for attempt in range(self.MAX_RETRIES):
                 try:
-                    resp = requests.post(self.api_url, headers=headers, json=data, timeout=30)
-                    resp.raise_for_status()
+                    llm_response = stream_json_response(_SESSION, self.api_url, data, timeout=30)
                     break
                 except requests.RequestException as e:
                     if attempt == self.MAX_RETRIES - 1:
                         print(f"Error extracting with LLM: {e}")
                         return {field: "" for field in fields}
-                    time.sleep(1)
-            
-            # Parse LLM response
-            result = resp.json()
-            llm_response = result.get("response", "")
+                    time.sleep(RETRY_DELAY / 2)
             
-            # Try to extract JSON from the response (it might be wrapped in markdown code blocks)
-            json_match = re.search(r'```(?:json)?\s*({.*?})\s*```', llm_response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_str = llm_response
+            # Extract the JSON object (it might be wrapped in markdown code blocks)
+            extracted_data = try_parse_json_response(llm_response)
+            if extracted_data is None:
+                print("Error in LLM extraction: no JSON object in response")
+                return {field: "" for field in fields}
             
-            # Clean up any non-JSON text that might be in the response
-            json_str = re.sub(r'^.*?({.*}).*?$', r'\1', json_str.strip(), flags=re.DOTALL)
+            # Callers fill in missing fields on the result, so cache a copy
+            with self._extraction_cache_lock:
+                self._extraction_cache[cache_key] = dict(extracted_data)
+                if len(self._extraction_cache) > EXTRACTION_CACHE_SIZE:
+                    self._extraction_cache.popitem(last=False)
             
-            # Parse the JSON response
-            extracted_data = json.loads(json_str)
-            
-            # Fallback - if JSON parsing fails, use regex to extract each field
             return extracted_data
             
         except Exception as e:
@@ -864,9 +1063,10 @@ class AssessmentFlowService:
         
         while retry_count < max_retries:
             try:
-                response = requests.post(
+                response = post_json(
+                    _SESSION,
                     self.api_url,
-                    json={
+                    {
                         "model": self.model,
                         "prompt": prompt,
                         "stream": False
@@ -875,14 +1075,14 @@ class AssessmentFlowService:
                 )
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = orjson.loads(response.content)
                     if 'response' in result:
                         return self._clean_llm_response(result['response'])
                 
                 print(f"LLM request failed with status code {response.status_code}")
                 retry_count += 1
                 if retry_count < max_retries:
-                    time.sleep(1)  # Wait before retrying
+                    time.sleep(RETRY_DELAY / 2)  # Wait before retrying
                     continue
                 
                 raise Exception(f"LLM service error: HTTP {response.status_code}")
@@ -891,7 +1091,7 @@ class AssessmentFlowService:
                 print(f"Request failed: {str(e)}")
                 retry_count += 1
                 if retry_count < max_retries:
-                    time.sleep(2)  # Wait longer before retrying
+                    time.sleep(RETRY_DELAY)  # Wait longer before retrying
                     continue
                 raise
         
@@ -909,18 +1109,8 @@ class AssessmentFlowService:
         """
         # Try to find JSON in the response
         try:
-            # Look for content between triple backticks
-            json_match = re.search(r"```(?:json)?(.*?)```", response, re.DOTALL)
-            if json_match:
-                return json_match.group(1).strip()
-            
-            # Look for content between curly braces
-            json_match = re.search(r"(\{.*\})", response, re.DOTALL)
-            if json_match:
-                return json_match.group(1).strip()
-            
-            # If no JSON found, return the raw response
-            return response.strip()
+            # Content between triple backticks or curly braces, else the raw response
+            return extract_json_text(response)
         except Exception as e:
             print(f"Error cleaning LLM response: {str(e)}")
             return response.strip()
@@ -1133,7 +1323,7 @@ class AssessmentFlowService:
         # For transitioning to export_motivation
         if current_step_id == 'export_experience' and next_step_id == 'export_motivation':
             export_exp = get_value('export_experience')
-            has_experience = not any(phrase in (export_exp or "").lower() for phrase in ["no", "none", "haven't", "havent", "not yet"])
+            has_experience = not NO_EXPORT_EXPERIENCE_RE.search(export_exp or "")
             
             if has_experience:
                 response = f"Thank you for sharing your export experience, {first_name}. I'd love to hear why {business_name} is looking to export now? What's driving this decision?"
@@ -1147,19 +1337,6 @@ class AssessmentFlowService:
             response += "Please select the markets you're most interested in exploring:"
             return response
             
-        # Create a context summary of the conversation so far
-        context = f"User's name: {first_name}\nBusiness name: {business_name}\n"
-        
-        # Add export experience if available
-        if 'export_experience' in user_data:
-            export_exp = get_value('export_experience')
-            context += f"Export experience: {export_exp}\n"
-        
-        # Add website if available
-        if 'website_url' in user_data:
-            website = get_value('website_url')
-            context += f"Website: {website}\n"
-        
         # Format a generic response if no special case matched
         # If we have a first name, always acknowledge the user
         if first_name and first_name != 'there':
@@ -1258,9 +1435,10 @@ class AssessmentFlowService:
             # Save the data to file
             with open(output_file, 'w') as f:
                 json.dump(scraped_data, f, indent=2)
+                bytes_written = f.tell()
             
-            # Check if the file was created and has content
-            if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
+            # Check the file has content, without stat-ing it again
+            if bytes_written > 0:
                 print(f"[SCRAPER] Successfully scraped data from {website_url}")
                 print(f"[SCRAPER] Data saved to {output_file}")
                 
@@ -1307,7 +1485,7 @@ class AssessmentFlowService:
             print(f"[ANALYSIS] use_mock_data = {user_data.get('use_mock_data', True)}")
             
             # Check if this is a Global Fresh domain - only one that uses mock data
-            is_demo_domain = any(term in domain.lower() for term in ['globalfresh', 'freshglobal']) or domain.lower() in ['globalfreshsa.co.za', 'freshglobal.co.za', 'example.com', 'test.com']
+            is_demo_domain = self._is_demo_domain(domain)
             
             if is_demo_domain and user_data.get('use_mock_data', True):
                 # Use mock data for analysis only for demo domains
@@ -1364,7 +1542,7 @@ class AssessmentFlowService:
                         # Create minimal data structure for LLM to work with
                         scraped_data = {
                             "companyInfo": {
-                                "name": domain.split('.')[0].title(),  # Use domain as company name
+                                "name": domain.partition('.')[0].title(),  # Use domain as company name
                                 "description": f"Company with domain {domain}"
                             },
                             "products": [],
@@ -1406,23 +1584,16 @@ class AssessmentFlowService:
         """
         if not url:
             return ""
+        return _extract_domain(url)
+    
+    def _is_demo_domain(self, domain: str) -> bool:
+        """
+        Check whether a domain is a demo domain that should use mock data.
+        
+        Args:
+            domain: Domain name
             
-        # Add protocol if missing
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-            
-        try:
-            # Parse the URL
-            parsed_url = urlparse(url)
-            
-            # Extract domain
-            domain = parsed_url.netloc
-            
-            # Remove www. prefix if present
-            if domain.startswith('www.'):
-                domain = domain[4:]
-                
-            return domain.lower()
-        except Exception as e:
-            print(f"Error extracting domain from URL '{url}': {e}")
-            return "" 
\ No newline at end of file
+        Returns:
+            True for Global Fresh and test domains
+        """
+        return DEMO_DOMAIN_RE.search(domain) is not None 
\ No newline at end of file
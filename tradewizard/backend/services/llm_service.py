@@ -1,9 +1,207 @@
 import requests
+import aiohttp
+import asyncio
+import threading
 import json
+import orjson
 import os
 import time
-import re
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Iterator, Callable
+from requests.adapters import HTTPAdapter
+
+def create_http_session(pool_size: int = 10) -> requests.Session:
+    """
+    Create a requests session with a keep-alive connection pool.
+    Reusing one session avoids a new TCP connection to the LLM server per call.
+    
+    Args:
+        pool_size: Maximum number of pooled connections per host
+        
+    Returns:
+        A configured requests.Session
+    """
+    session = requests.Session()
+    # Retries are handled by the callers' own retry loops
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
+    return session
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Upper bound on simultaneous connections from the async paths, so a large
+# fan-out queues client-side instead of flooding the LLM server
+MAX_CONCURRENT_REQUESTS = int(os.environ.get("LLM_MAX_CONCURRENT_REQUESTS", "10"))
+
+def create_async_session() -> aiohttp.ClientSession:
+    """
+    Create an aiohttp session with a bounded connection pool.
+    Must be called from within a running event loop.
+    
+    Returns:
+        A configured aiohttp.ClientSession
+    """
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS))
+
+def post_json(session: requests.Session, url: str, payload: Dict[str, Any],
+              headers: Optional[Dict[str, str]] = None, timeout: float = 30,
+              **kwargs) -> requests.Response:
+    """
+    POST a JSON payload to the LLM API.
+    Encodes with orjson, which is considerably faster than the stdlib
+    encoder used by requests' json= argument.
+    
+    Args:
+        session: Session to send the request on
+        url: Endpoint URL
+        payload: JSON-serializable request body
+        headers: Request headers (defaults to a JSON content type)
+        timeout: Request timeout in seconds
+        
+    Returns:
+        The HTTP response
+    """
+    return session.post(
+        url,
+        data=orjson.dumps(payload),
+        headers=headers or JSON_HEADERS,
+        timeout=timeout,
+        **kwargs
+    )
+
+def extract_json_text(text: str) -> str:
+    """
+    Pull the JSON object out of an LLM response.
+    A response that is already a bare object, as the prompts ask for, is
+    returned as-is. Otherwise prefers the contents of a ``` fenced block, then
+    the span from the first '{' to the last '}'. Uses plain substring searches,
+    so the cost stays linear in the response length whatever the model returns.
+    
+    Args:
+        text: Raw LLM response
+        
+    Returns:
+        The JSON text, or the stripped response if no object is found
+    """
+    stripped = text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        return stripped
+    
+    fence_start = text.find("```")
+    if fence_start != -1:
+        fence_end = text.find("```", fence_start + 3)
+        if fence_end != -1:
+            text = text[fence_start + 3:fence_end]
+            if text.startswith("json"):
+                text = text[4:]
+    
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end > start:
+        return text[start:end + 1]
+    return text.strip()
+
+def parse_json_response(text: str) -> Any:
+    """
+    Parse the JSON object out of an LLM response.
+    
+    Args:
+        text: Raw LLM response
+        
+    Returns:
+        The decoded JSON value
+        
+    Raises:
+        orjson.JSONDecodeError: If no valid JSON is found (a json.JSONDecodeError subclass)
+    """
+    return orjson.loads(extract_json_text(text))
+
+def try_parse_json_response(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the JSON object out of an LLM response without raising.
+    Responses that contain no object at all (error strings, refusals, plain
+    prose) are rejected by a cheap check instead of a failed decode.
+    
+    Args:
+        text: Raw LLM response
+        
+    Returns:
+        The decoded JSON object, or None if the response doesn't contain one
+    """
+    json_text = extract_json_text(text)
+    if not json_text.startswith("{"):
+        return None
+    try:
+        return orjson.loads(json_text)
+    except orjson.JSONDecodeError:
+        return None
+
+def stream_json_response(session: requests.Session, url: str, payload: Dict[str, Any],
+                         headers: Optional[Dict[str, str]] = None, timeout: float = 30) -> str:
+    """
+    Generate a JSON answer from the Ollama generate API, streaming the tokens.
+    Reading stops as soon as the first top-level JSON object is complete, so
+    any trailing commentary the model adds is never waited for.
+    
+    Args:
+        session: Session to send the request on
+        url: Ollama generate endpoint URL
+        payload: Request body, without "stream"; the response is always streamed
+        headers: Request headers (defaults to a JSON content type)
+        timeout: Request timeout in seconds
+        
+    Returns:
+        The generated text, up to the end of the first complete JSON object
+        
+    Raises:
+        requests.RequestException: If the API call fails
+    """
+    parts = []
+    depth = 0
+    in_string = False
+    escaped = False
+    
+    with post_json(session, url, dict(payload, stream=True), headers=headers,
+                   timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        
+        # Ollama streams one JSON object per line
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = orjson.loads(line)
+            text = chunk.get("response", "")
+            
+            # Track brace depth outside of string literals across chunks
+            for i, char in enumerate(text):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == "\\":
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                elif char == '"':
+                    in_string = depth > 0
+                elif char == "{":
+                    depth += 1
+                elif char == "}" and depth > 0:
+                    depth -= 1
+                    if depth == 0:
+                        parts.append(text[:i + 1])
+                        return "".join(parts)
+            
+            parts.append(text)
+            if chunk.get("done"):
+                break
+    
+    return "".join(parts)
+
+# Seconds to wait before retrying a failed LLM request. Set to 0 in tests
+# and local runs against a mock server so retries don't add wall-clock time.
+RETRY_DELAY = float(os.environ.get("LLM_RETRY_DELAY", "2"))
 
 class LLMService:
     """
@@ -14,16 +212,96 @@ class LLMService:
     def __init__(self):
         # API configuration - default to using local LLM
         self.api_url = os.environ.get("LLM_API_URL", "http://localhost:11434/api/generate")
+        self.chat_url = os.environ.get("LLM_CHAT_URL", "http://localhost:11434/api/chat")
         self.model = os.environ.get("LLM_MODEL", "mistral")
         self.api_key = os.environ.get("LLM_API_KEY", "")
+        # The API key is fixed for the service's lifetime, so build the headers once
+        self.headers = self._build_headers()
         
         # Set to true to log more details about API calls
         self.debug = False
         
         # Retry configuration
         self.max_retries = 3
-        self.retry_delay = 2  # seconds
+        self.retry_delay = RETRY_DELAY  # seconds
+        
+        # Pooled HTTP session reused across calls
+        self.session = create_http_session()
+        
+        # How long Ollama keeps the model loaded after a warmup request
+        self.keep_alive = os.environ.get("LLM_KEEP_ALIVE", "30m")
+        self._warmed = False
+        self._warmup_lock = threading.Lock()
         
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+    
+    def warmup(self) -> bool:
+        """
+        Load the model into memory ahead of the first real request.
+        Sends an empty prompt, which Ollama treats as a load-only request, and
+        opens the pooled connection. Only the first successful call does any work.
+        
+        Returns:
+            True if the model is warm
+        """
+        with self._warmup_lock:
+            if self._warmed:
+                return True
+            
+            try:
+                response = post_json(
+                    self.session,
+                    self.api_url,
+                    {
+                        "model": self.model,
+                        "prompt": "",
+                        "keep_alive": self.keep_alive,
+                        "stream": False
+                    },
+                    headers=self.headers,
+                    timeout=60  # loading a model from disk can take a while
+                )
+                self._warmed = response.status_code == 200
+            except requests.RequestException as e:
+                print(f"LLM warmup failed: {str(e)}")
+            
+            return self._warmed
+        
+    def _build_request(self, prompt: str, max_tokens: int, temperature: float):
+        """Build the payload and headers for an API call."""
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+        
+        return payload, self.headers
+    
+    def _build_headers(self) -> Dict[str, str]:
+        """Build the headers for an API call."""
+        headers = {
+            "Content-Type": "application/json"
+        }
+        
+        # Add API key if provided
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        
+        return headers
+    
+    def _extract_text(self, response_data: Any) -> str:
+        """Extract the generated text from an API response body."""
+        # Adjust based on API response format
+        if "response" in response_data:
+            return response_data["response"]
+        elif "choices" in response_data:
+            return response_data["choices"][0]["text"]
+        else:
+            return str(response_data)
+    
     def generate(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.7) -> str:
         """
         Generate text using the LLM API.
@@ -40,48 +318,31 @@ class LLMService:
         for attempt in range(self.max_retries):
             try:
                 # Prepare the API request
-                payload = {
-                    "model": self.model,
-                    "prompt": prompt,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens
-                }
-                
-                headers = {
-                    "Content-Type": "application/json"
-                }
-                
-                # Add API key if provided
-                if self.api_key:
-                    headers["Authorization"] = f"Bearer {self.api_key}"
+                payload, headers = self._build_request(prompt, max_tokens, temperature)
                 
                 if self.debug:
                     print(f"LLM Request - Attempt {attempt+1}:")
                     print(f"Prompt: {prompt[:150]}...")
                 
                 # Make the API call
-                response = requests.post(
+                response = post_json(
+                    self.session,
                     self.api_url,
+                    payload,
                     headers=headers,
-                    data=json.dumps(payload),
                     timeout=30  # 30 second timeout
                 )
                 
                 # Check for successful response
                 if response.status_code == 200:
                     # Parse the response
-                    response_data = response.json()
+                    response_data = orjson.loads(response.content)
                     
                     if self.debug:
-                        print(f"LLM Response: {response_data[:150]}...")
+                        print(f"LLM Response: {str(response_data)[:150]}...")
                     
-                    # Extract the generated text - adjust based on API response format
-                    if "response" in response_data:
-                        return response_data["response"]
-                    elif "choices" in response_data:
-                        return response_data["choices"][0]["text"]
-                    else:
-                        return str(response_data)
+                    # Extract the generated text
+                    return self._extract_text(response_data)
                 else:
                     print(f"LLM API error (HTTP {response.status_code}): {response.text}")
                     
@@ -105,6 +366,158 @@ class LLMService:
         # If we get here, all attempts failed
         return "Error: Failed to get a response from the LLM API after multiple attempts"
     
+    def stream_chat(self, message: str, system_prompt: Optional[str] = None,
+                    temperature: float = 0.7) -> Iterator[str]:
+        """
+        Stream a chat completion token by token.
+        Tokens are yielded as the model produces them, so callers can forward
+        them to the client instead of waiting for the full response.
+        
+        Args:
+            message: The user message to send to the LLM
+            system_prompt: Optional system prompt to set the assistant's role
+            temperature: Temperature for generation (higher = more creative)
+            
+        Returns:
+            Iterator over the generated text chunks
+            
+        Raises:
+            requests.RequestException: If the API call fails
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": message})
+        
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+            "options": {"temperature": temperature}
+        }
+        
+        with post_json(
+            self.session,
+            self.chat_url,
+            payload,
+            headers=self.headers,
+            stream=True,
+            timeout=30
+        ) as response:
+            response.raise_for_status()
+            
+            # Ollama streams one JSON object per line
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                content = chunk.get("message", {}).get("content")
+                if content:
+                    yield content
+                if chunk.get("done"):
+                    break
+    
+    async def agenerate(self, session: aiohttp.ClientSession, prompt: str,
+                        max_tokens: int = 1000, temperature: float = 0.7) -> str:
+        """
+        Generate text using the LLM API without blocking the event loop.
+        Same retry and error behaviour as generate().
+        
+        Args:
+            session: Shared aiohttp session to send the request on
+            prompt: The prompt to send to the LLM
+            max_tokens: Maximum number of tokens to generate
+            temperature: Temperature for generation (higher = more creative)
+            
+        Returns:
+            The generated text response
+        """
+        payload, headers = self._build_request(prompt, max_tokens, temperature)
+        
+        for attempt in range(self.max_retries):
+            try:
+                async with session.post(
+                    self.api_url,
+                    headers=headers,
+                    data=orjson.dumps(payload),
+                    timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    if response.status == 200:
+                        return self._extract_text(await response.json(content_type=None))
+                    
+                    print(f"LLM API error (HTTP {response.status}): {await response.text()}")
+                    if attempt == self.max_retries - 1:
+                        return f"Error: API returned status code {response.status}"
+                        
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                print(f"LLM API exception: {str(e)}")
+                if attempt == self.max_retries - 1:
+                    return f"Error: {str(e)}"
+            
+            await asyncio.sleep(self.retry_delay)
+        
+        return "Error: Failed to get a response from the LLM API after multiple attempts"
+    
+    async def _agenerate_many(self, prompts: List[str], max_tokens: int, temperature: float,
+                              total_timeout: Optional[float],
+                              on_result: Optional[Callable[[int, str], None]]) -> List[str]:
+        """Send all prompts concurrently over one session, handling each as it completes."""
+        results = ["Error: Timed out waiting for the LLM API"] * len(prompts)
+        
+        async with create_async_session() as session:
+            async def run(index: int, prompt: str):
+                return index, await self.agenerate(session, prompt, max_tokens, temperature)
+            
+            tasks = [asyncio.ensure_future(run(index, prompt)) for index, prompt in enumerate(prompts)]
+            try:
+                for next_done in asyncio.as_completed(tasks, timeout=total_timeout):
+                    index, text = await next_done
+                    results[index] = text
+                    if on_result:
+                        on_result(index, text)
+            except asyncio.TimeoutError:
+                print(f"LLM API batch timed out after {total_timeout}s")
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return results
+    
+    def generate_many(self, prompts: List[str], max_tokens: int = 1000, temperature: float = 0.7,
+                      total_timeout: Optional[float] = None,
+                      on_result: Optional[Callable[[int, str], None]] = None) -> List[str]:
+        """
+        Generate responses for several independent prompts concurrently.
+        Total wall time is roughly that of the slowest prompt rather than the sum.
+        Ollama only serves requests in parallel up to OLLAMA_NUM_PARALLEL.
+        Safe to call from inside a running event loop, though the caller
+        blocks until the batch finishes.
+        
+        Args:
+            prompts: The prompts to send to the LLM
+            max_tokens: Maximum number of tokens to generate
+            temperature: Temperature for generation (higher = more creative)
+            total_timeout: Overall time limit in seconds; prompts still pending
+                when it expires get an error response
+            on_result: Called with (index, response) as each prompt completes,
+                in completion order
+            
+        Returns:
+            The generated text responses, in the same order as the prompts
+        """
+        if not prompts:
+            return []
+        batch = self._agenerate_many(prompts, max_tokens, temperature, total_timeout, on_result)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(batch)
+        
+        # asyncio.run refuses to start inside a running loop (e.g. an async
+        # view), so run the batch on its own loop in a worker thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, batch).result()
+    
     def extract_structured_data(self, text: str, schema: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract structured data from text using the LLM.
@@ -133,17 +546,30 @@ class LLMService:
         # Generate response
         response = self.generate(prompt)
         
-        # Try to parse response as JSON
-        try:
-            # Find JSON in the response - it might be surrounded by markdown code blocks
-            json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```|({[\s\S]*})', response)
-            if json_match:
-                json_str = json_match.group(1) or json_match.group(2)
-                return json.loads(json_str)
-            else:
-                return json.loads(response)
-        except json.JSONDecodeError as e:
-            print(f"Error parsing LLM response as JSON: {e}")
+        # Find JSON in the response - it might be surrounded by markdown code blocks
+        data = try_parse_json_response(response)
+        if data is None:
+            print("Error parsing LLM response as JSON")
             print(f"Response: {response}")
             # Return empty data
-            return {} 
\ No newline at end of file
+            return {}
+        return data
+
+
+_shared_service = None
+_shared_service_lock = threading.Lock()
+
+def get_llm_service() -> LLMService:
+    """
+    Get the process-wide LLMService, creating it on first use.
+    Sharing one instance shares its connection pool and warmup state.
+    
+    Returns:
+        The shared LLMService instance
+    """
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = LLMService()
+        return _shared_service
+
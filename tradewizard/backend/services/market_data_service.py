@@ -1,9 +1,63 @@
-import requests
-import json
+import copy
 import os
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
 import re
-from .llm_service import LLMService
+from .llm_service import get_llm_service, try_parse_json_response
+
+# Overall limit for generating live market data for several categories at once
+LIVE_MARKET_DATA_TIMEOUT = 90  # seconds
+
+# Number of categories whose generated market data is kept in memory
+LIVE_MARKET_DATA_CACHE_SIZE = 256
+
+# Upper bound on remembered category -> mock category resolutions
+MOCK_CATEGORY_ALIAS_LIMIT = 1024
+
+# Keys every entry of a generated list must carry, as read by MarketIntelligenceService
+TOP_MARKET_KEYS = ('country', 'score', 'reason')
+BARRIER_KEYS = ('country', 'barrier', 'impact')
+
+# Market data used when generation fails. Like the mock and cached entries
+# it is shared, so the public methods hand out copies.
+DEFAULT_MARKET_DATA = {
+    "top_markets": [
+        {"country": "Global", "score": 0.7, "reason": "Limited data available"}
+    ],
+    "growth_rate": "Unknown",
+    "market_size": "Unknown",
+    "trends": [
+        "Data currently unavailable"
+    ],
+    "barriers": [
+        {"country": "General", "barrier": "Research needed", "impact": "unknown"}
+    ]
+}
+
+def _has_keys(items: Any, keys: tuple) -> bool:
+    """Check that items is a list of dicts that all carry the given keys."""
+    return isinstance(items, list) and all(
+        isinstance(item, dict) and all(key in item for key in keys) for item in items
+    )
+
+def is_valid_market_data(data: Any) -> bool:
+    """
+    Check the shape of market data decoded from an LLM response.
+    
+    Args:
+        data: Decoded JSON value
+        
+    Returns:
+        True if the data can be used in place of the mock data
+    """
+    return (
+        isinstance(data, dict)
+        and _has_keys(data.get('top_markets'), TOP_MARKET_KEYS)
+        and all(isinstance(market['score'], (int, float)) for market in data['top_markets'])
+        and isinstance(data.get('trends', []), list)
+        and _has_keys(data.get('barriers', []), BARRIER_KEYS)
+    )
 
 class MarketDataService:
     """
@@ -15,9 +69,13 @@ class MarketDataService:
     """
     
     def __init__(self):
-        self.llm = LLMService()
+        self.llm = get_llm_service()
         self.use_mock_data = os.environ.get("USE_MOCK_MARKET_DATA", "true").lower() == "true"
         
+        # LRU cache of LLM-generated market data, keyed by normalized category
+        self._live_cache = OrderedDict()
+        self._live_cache_lock = threading.Lock()
+        
         # Mock data for development/demo purposes
         self._initialize_mock_data()
     
@@ -79,6 +137,13 @@ class MarketDataService:
                 ]
             }
         }
+        
+        # Requested category -> mock data category, starting with the exact
+        # and lowercase names; similar categories are added as they're resolved
+        self._mock_category_aliases = {}
+        for name in self.mock_data:
+            self._mock_category_aliases[name] = name
+            self._mock_category_aliases.setdefault(name.lower(), name)
     
     def get_market_data_for_category(self, category: str, use_mock: bool = None) -> Dict[str, Any]:
         """
@@ -96,21 +161,43 @@ class MarketDataService:
         
         if use_mock:
             # Use mock data
-            if category in self.mock_data:
-                return self.mock_data[category]
-            
-            # Try to find a similar category
-            for mock_category in self.mock_data:
-                if self._category_similarity(category, mock_category) > 0.7:
-                    print(f"Using similar category mock data: {mock_category} for {category}")
-                    return self.mock_data[mock_category]
+            data = self.mock_data[self._resolve_mock_category(category)]
+        else:
+            # Use LLM to generate market data
+            data = self._generate_market_data_with_llm(category)
+        
+        # Callers get their own copy, so changing it can't leak into later requests
+        return copy.deepcopy(data)
+    
+    def _resolve_mock_category(self, category: str) -> str:
+        """
+        Find the mock data category to use for a requested category.
+        Resolved names are remembered, so the similarity scan runs once per category.
+        
+        Args:
+            category: The requested product category
             
+        Returns:
+            Key into self.mock_data
+        """
+        mock_category = self._mock_category_aliases.get(category)
+        if mock_category is not None:
+            return mock_category
+        
+        # Try to find a similar category
+        for candidate in self.mock_data:
+            if self._category_similarity(category, candidate) > 0.7:
+                print(f"Using similar category mock data: {candidate} for {category}")
+                mock_category = candidate
+                break
+        else:
             # Default to first mock category if no match found
             print(f"No matching mock data for category: {category}, using default")
-            return next(iter(self.mock_data.values()))
-        else:
-            # Use LLM to generate market data
-            return self._generate_market_data_with_llm(category)
+            mock_category = next(iter(self.mock_data))
+        
+        if len(self._mock_category_aliases) < MOCK_CATEGORY_ALIAS_LIMIT:
+            self._mock_category_aliases[category] = mock_category
+        return mock_category
     
     def _category_similarity(self, category1: str, category2: str) -> float:
         """Simple similarity check between categories"""
@@ -138,18 +225,9 @@ class MarketDataService:
         
         return similarity
     
-    def _generate_market_data_with_llm(self, category: str) -> Dict[str, Any]:
-        """
-        Generate market data using LLM with web search capabilities.
-        This simulates searching for and synthesizing market data.
-        
-        Args:
-            category: The product category to generate market data for
-            
-        Returns:
-            Dictionary with generated market data
-        """
-        prompt = f"""
+    def _market_data_prompt(self, category: str) -> str:
+        """Build the LLM prompt used to generate market data for a category."""
+        return f"""
         As a market intelligence expert, provide detailed export market data for {category}.
         
         Return a JSON object with this exact structure:
@@ -175,42 +253,81 @@ class MarketDataService:
         Make realistic estimates based on current global market conditions.
         Return ONLY valid JSON, nothing else.
         """
+    
+    def _parse_market_data(self, llm_response: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse the market data JSON out of an LLM response.
+        
+        Args:
+            llm_response: Raw text returned by the LLM
+            
+        Returns:
+            Dictionary with market data, or None if parsing fails or the data has the wrong shape
+        """
+        # Find JSON in the response; error strings from failed calls are rejected up front
+        data = try_parse_json_response(llm_response)
+        if data is None:
+            print("Error generating market data with LLM: no JSON object in response")
+            return None
+        
+        # Check the shape once here, so the compile steps can index fields directly
+        if not is_valid_market_data(data):
+            print("Error generating market data with LLM: unexpected data structure")
+            return None
+        return data
+    
+    def _cached_market_data(self, category: str) -> Optional[Dict[str, Any]]:
+        """Look up previously generated market data for a category."""
+        key = category.strip().lower()
+        with self._live_cache_lock:
+            data = self._live_cache.get(key)
+            if data is not None:
+                self._live_cache.move_to_end(key)
+            return data
+    
+    def _store_market_data(self, category: str, llm_response: str) -> Dict[str, Any]:
+        """
+        Parse generated market data and cache it if it is valid.
         
-        try:
-            # Generate market data
-            llm_response = self.llm.generate(prompt)
+        Args:
+            category: The product category the data was generated for
+            llm_response: Raw text returned by the LLM
             
-            # Parse the JSON response
-            import json
-            import re
+        Returns:
+            The parsed market data, or the default structure if parsing failed
+        """
+        data = self._parse_market_data(llm_response)
+        if data is None:
+            # Failures aren't cached, so the next request tries again
+            return DEFAULT_MARKET_DATA
+        
+        with self._live_cache_lock:
+            self._live_cache[category.strip().lower()] = data
+            if len(self._live_cache) > LIVE_MARKET_DATA_CACHE_SIZE:
+                self._live_cache.popitem(last=False)
+        return data
+    
+    def _generate_market_data_with_llm(self, category: str) -> Dict[str, Any]:
+        """
+        Generate market data using LLM with web search capabilities.
+        This simulates searching for and synthesizing market data.
+        Results are cached per category, so repeat requests skip the LLM.
+        
+        Args:
+            category: The product category to generate market data for
             
-            # Find JSON in the response
-            json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```|({[\s\S]*})', llm_response)
-            if json_match:
-                json_str = json_match.group(1) or json_match.group(2)
-                return json.loads(json_str)
-            else:
-                return json.loads(llm_response)
-        except Exception as e:
-            print(f"Error generating market data with LLM: {str(e)}")
-            # Return default structure on error
-            return {
-                "top_markets": [
-                    {"country": "Global", "score": 0.7, "reason": "Limited data available"}
-                ],
-                "growth_rate": "Unknown",
-                "market_size": "Unknown",
-                "trends": [
-                    "Data currently unavailable"
-                ],
-                "barriers": [
-                    {"country": "General", "barrier": "Research needed", "impact": "unknown"}
-                ]
-            }
+        Returns:
+            Dictionary with generated market data
+        """
+        cached = self._cached_market_data(category)
+        if cached is not None:
+            return cached
+        return self._store_market_data(category, self.llm.generate(self._market_data_prompt(category)))
     
     def get_market_data_for_products(self, products: List[str], use_mock: bool = None) -> Dict[str, Dict[str, Any]]:
         """
         Get market data for multiple product categories.
+        When generating with the LLM, all uncached categories are requested concurrently.
         
         Args:
             products: List of product categories to get market data for
@@ -219,9 +336,59 @@ class MarketDataService:
         Returns:
             Dictionary mapping categories to their market data
         """
+        if use_mock is None:
+            use_mock = self.use_mock_data
+        
+        if not use_mock:
+            market_data = {}
+            pending = []
+            for category in dict.fromkeys(products):
+                cached = self._cached_market_data(category)
+                if cached is not None:
+                    market_data[category] = cached
+                else:
+                    pending.append(category)
+            
+            # Parse each category's data as soon as its response arrives
+            def on_result(index: int, response: str):
+                market_data[pending[index]] = self._store_market_data(pending[index], response)
+            
+            if pending:
+                self.llm.generate_many(
+                    [self._market_data_prompt(c) for c in pending],
+                    total_timeout=LIVE_MARKET_DATA_TIMEOUT,
+                    on_result=on_result
+                )
+            
+            # Results arrive cached-first, then in completion order, so rebuild
+            # them in request order; categories that timed out fall back to
+            # the default structure
+            return {
+                category: copy.deepcopy(market_data.get(category, DEFAULT_MARKET_DATA))
+                for category in dict.fromkeys(products)
+            }
+        
         result = {}
         
         for product in products:
             result[product] = self.get_market_data_for_category(product, use_mock)
-            
-        return result 
\ No newline at end of file
+        
+        return result
+
+
+_shared_service = None
+_shared_service_lock = threading.Lock()
+
+def get_market_data_service() -> MarketDataService:
+    """
+    Get the process-wide MarketDataService, creating it on first use.
+    Every assessment flow then reads from one live data cache.
+    
+    Returns:
+        The shared MarketDataService instance
+    """
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = MarketDataService()
+        return _shared_service
@@ -1,10 +1,22 @@
 from typing import Dict, List, Any, Optional
-import time
-import random
 import os
 import json
-from .market_data_service import MarketDataService
-from .market_intelligence_service import MarketIntelligenceService as StructuredMarketIntelligenceService
+from types import MappingProxyType
+from .market_data_service import get_market_data_service
+from .market_intelligence_service import MarketIntelligenceService as StructuredMarketIntelligenceService, Rating
+
+# Common market name variations (lowercase, spaces removed) -> canonical key.
+# Read-only, since it is shared by every lookup.
+MARKET_NAME_ALIASES = MappingProxyType({
+    'unitedkingdom': 'uk',
+    'uk': 'uk',
+    'unitedstates': 'usa',
+    'usa': 'usa',
+    'us': 'usa',
+    'unitedarabemirates': 'uae',
+    'uae': 'uae',
+    'emirates': 'uae'
+})
 
 class MarketIntelligenceService:
     """
@@ -14,7 +26,7 @@ class MarketIntelligenceService:
     """
     
     def __init__(self):
-        self.market_data_service = MarketDataService()
+        self.market_data_service = get_market_data_service()
         # Initialize structured market intelligence service
         self.structured_market_service = StructuredMarketIntelligenceService()
         # Legacy market data store
@@ -99,30 +111,13 @@ class MarketIntelligenceService:
         # Extract product categories
         categories = products.get('categories', [])
         
-        # Get market data for each category
-        market_data = {}
-        for category in categories:
-            market_data[category] = self.market_data_service.get_market_data_for_category(
-                category, use_mock=use_mock_data
-            )
-        
-        # Compile opportunities
-        opportunities = []
-        for category, data in market_data.items():
-            # Add top markets as opportunities
-            for market in data.get('top_markets', []):
-                opportunities.append({
-                    "product_category": category,
-                    "market": market['country'],
-                    "opportunity_score": market['score'],
-                    "description": market['reason']
-                })
-        
-        # Sort opportunities by score (descending)
-        opportunities.sort(key=lambda x: x['opportunity_score'], reverse=True)
+        # Get market data for all categories (fetched concurrently when live)
+        market_data = self.market_data_service.get_market_data_for_products(
+            categories, use_mock=use_mock_data
+        )
         
         return {
-            "opportunities": opportunities
+            "opportunities": self._compile_opportunities(market_data)
         }
     
     def get_market_trends(self, products: Dict[str, Any], use_mock_data: bool = None) -> Dict[str, Any]:
@@ -144,24 +139,13 @@ class MarketIntelligenceService:
         # Extract product categories
         categories = products.get('categories', [])
         
-        # Get market data for each category
-        market_data = {}
-        for category in categories:
-            market_data[category] = self.market_data_service.get_market_data_for_category(
-                category, use_mock=use_mock_data
-            )
-        
-        # Compile trends
-        all_trends = []
-        for category, data in market_data.items():
-            for trend in data.get('trends', []):
-                all_trends.append({
-                    "product_category": category,
-                    "trend": trend
-                })
+        # Get market data for all categories (fetched concurrently when live)
+        market_data = self.market_data_service.get_market_data_for_products(
+            categories, use_mock=use_mock_data
+        )
         
         return {
-            "trends": all_trends
+            "trends": self._compile_trends(market_data)
         }
     
     def get_trade_barriers(self, products: Dict[str, Any], use_mock_data: bool = None) -> Dict[str, Any]:
@@ -183,26 +167,13 @@ class MarketIntelligenceService:
         # Extract product categories
         categories = products.get('categories', [])
         
-        # Get market data for each category
-        market_data = {}
-        for category in categories:
-            market_data[category] = self.market_data_service.get_market_data_for_category(
-                category, use_mock=use_mock_data
-            )
-        
-        # Compile barriers
-        all_barriers = []
-        for category, data in market_data.items():
-            for barrier in data.get('barriers', []):
-                all_barriers.append({
-                    "product_category": category,
-                    "market": barrier['country'],
-                    "barrier": barrier['barrier'],
-                    "impact": barrier['impact']
-                })
+        # Get market data for all categories (fetched concurrently when live)
+        market_data = self.market_data_service.get_market_data_for_products(
+            categories, use_mock=use_mock_data
+        )
         
         return {
-            "barriers": all_barriers
+            "barriers": self._compile_barriers(market_data)
         }
     
     def get_market_data_summary(self, products: Dict[str, Any], use_mock_data: bool = None) -> Dict[str, Any]:
@@ -216,16 +187,71 @@ class MarketIntelligenceService:
         Returns:
             Dictionary with comprehensive market data
         """
-        opportunities = self.get_market_opportunities(products, use_mock_data)
-        trends = self.get_market_trends(products, use_mock_data)
-        barriers = self.get_trade_barriers(products, use_mock_data)
+        if not products or not products.get('categories'):
+            return {
+                "opportunities": [],
+                "trends": [],
+                "barriers": []
+            }
+        
+        # Fetch market data once and derive all three views from it
+        market_data = self.market_data_service.get_market_data_for_products(
+            products.get('categories', []), use_mock=use_mock_data
+        )
         
         return {
-            "opportunities": opportunities['opportunities'],
-            "trends": trends['trends'],
-            "barriers": barriers['barriers']
+            "opportunities": self._compile_opportunities(market_data),
+            "trends": self._compile_trends(market_data),
+            "barriers": self._compile_barriers(market_data)
         }
     
+    def _compile_opportunities(self, market_data: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build the opportunity list from per-category market data, best first."""
+        opportunities = []
+        for category, data in market_data.items():
+            # Add top markets as opportunities
+            for market in data.get('top_markets', []):
+                opportunities.append({
+                    "product_category": category,
+                    "market": market['country'],
+                    "opportunity_score": market['score'],
+                    "description": market['reason']
+                })
+        
+        # Sort opportunities by score (descending)
+        opportunities.sort(key=lambda x: x['opportunity_score'], reverse=True)
+        
+        return opportunities
+    
+    def _compile_trends(self, market_data: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build the trend list from per-category market data."""
+        all_trends = []
+        for category, data in market_data.items():
+            for trend in data.get('trends', []):
+                all_trends.append({
+                    "product_category": category,
+                    "trend": trend
+                })
+        
+        return all_trends
+    
+    def _compile_barriers(self, market_data: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build the trade barrier list from per-category market data."""
+        all_barriers = []
+        for category, data in market_data.items():
+            for barrier in data.get('barriers', []):
+                all_barriers.append({
+                    "product_category": category,
+                    "market": barrier['country'],
+                    "barrier": barrier['barrier'],
+                    "impact": barrier['impact']
+                })
+        
+        # Sort barriers by impact (highest first) so callers can take the top ones directly
+        all_barriers.sort(key=lambda x: Rating.parse(x['impact'], default=-1), reverse=True)
+        
+        return all_barriers
+    
     def get_market_options(self, product_categories: List[str], use_mock_data: bool = True, user_data: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
         Get market options based on product categories.
@@ -353,18 +379,7 @@ class MarketIntelligenceService:
         normalized = market_name.lower().replace(' ', '')
         
         # Handle common market name variations
-        market_mapping = {
-            'unitedkingdom': 'uk',
-            'uk': 'uk',
-            'unitedstates': 'usa',
-            'usa': 'usa',
-            'us': 'usa',
-            'unitedarabemirates': 'uae',
-            'uae': 'uae',
-            'emirates': 'uae'
-        }
-        
-        return market_mapping.get(normalized, normalized)
+        return MARKET_NAME_ALIASES.get(normalized, normalized)
         
     def _generate_simple_market_data(self, market_name: str, product_categories: List[str]) -> Dict[str, Any]:
         """
@@ -399,18 +414,19 @@ class MarketIntelligenceService:
             }
         }
         
-        # Customize based on known markets
-        if "uk" in market_name.lower() or "kingdom" in market_name.lower():
+        # Customize based on known markets (lowercase once, not per check)
+        name = market_name.lower()
+        if "uk" in name or "kingdom" in name:
             result["market_overview"]["country"] = "United Kingdom"
             result["market_size"]["value"] = "$24.5 billion"
             result["growth_rate"]["value"] = "3.2% per year"
             result["match_score"] = 85
-        elif "us" in market_name.lower() or "states" in market_name.lower():
+        elif "us" in name or "states" in name:
             result["market_overview"]["country"] = "United States"
             result["market_size"]["value"] = "$156.2 billion"
             result["growth_rate"]["value"] = "3.9% per year"
             result["match_score"] = 82
-        elif "uae" in market_name.lower() or "emirates" in market_name.lower():
+        elif "uae" in name or "emirates" in name:
             result["market_overview"]["country"] = "United Arab Emirates"
             result["market_size"]["value"] = "$12.3 billion"
             result["growth_rate"]["value"] = "4.5% per year" 
@@ -1,7 +1,34 @@
 import os
 import json
+import re
+import threading
+from enum import IntEnum
 from typing import Dict, List, Any, Optional
 
+class Rating(IntEnum):
+    """
+    Ordinal rating used for entry barriers, regulatory complexity and impact levels.
+    The market data stores these as 'Low'/'Medium'/'High' strings (in any case).
+    """
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    
+    @classmethod
+    def parse(cls, value: Any, default: Optional["Rating"] = None) -> Optional["Rating"]:
+        """Convert a rating string to a Rating, or return the default if unrecognized"""
+        return cls.__members__.get(str(value).strip().upper(), default)
+
+# Estimated months to market entry for each entry barrier rating
+ENTRY_BARRIER_TIMELINE_MONTHS = {
+    Rating.LOW: 6,
+    Rating.MEDIUM: 9,
+    Rating.HIGH: 12
+}
+
+# Integers in a timeframe string such as "6-10 months"
+TIMEFRAME_NUMBER_RE = re.compile(r'\d+')
+
 class MarketIntelligenceService:
     """
     Service for providing structured market intelligence data.
@@ -12,7 +39,21 @@ class MarketIntelligenceService:
         # Path to the structured market data
         self.data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "market_intelligence")
         self.data_file = os.path.join(self.data_dir, "market_data.json")
-        self.market_data = self._load_market_data()
+        # Loaded on first use, so processes that never serve market
+        # intelligence don't parse the file
+        self._market_data = None
+        self._market_data_lock = threading.Lock()
+        # The market list only depends on the loaded data, so it is built once
+        self._available_markets = None
+    
+    @property
+    def market_data(self) -> Dict[str, Any]:
+        """The structured market intelligence data, loaded on first access"""
+        if self._market_data is None:
+            with self._market_data_lock:
+                if self._market_data is None:
+                    self._market_data = self._load_market_data()
+        return self._market_data
         
     def _load_market_data(self) -> Dict[str, Any]:
         """
@@ -32,6 +73,15 @@ class MarketIntelligenceService:
         """
         Returns the list of available markets with their basic information
         """
+        if self._available_markets is None:
+            self._available_markets = tuple(self._build_available_markets())
+        # Copies, since callers add business context to the descriptions
+        return [dict(market) for market in self._available_markets]
+    
+    def _build_available_markets(self) -> List[Dict[str, Any]]:
+        """
+        Builds the market list, sorted by match score, from the loaded data
+        """
         markets = []
         
         try:
@@ -172,23 +222,18 @@ class MarketIntelligenceService:
                         # Parse timeframe like "6-10 months"
                         timeframe = details["timeframe"]
                         if "month" in timeframe.lower():
-                            # Extract numeric values
-                            nums = [int(s) for s in timeframe.split() if s.isdigit()]
+                            # Extract numeric values (ranges are not whitespace separated)
+                            nums = TIMEFRAME_NUMBER_RE.findall(timeframe)
                             if nums:
-                                entry_times.append(min(nums))
+                                entry_times.append(min(map(int, nums)))
                 
                 if entry_times:
                     timeline = min(entry_times)
             
             # If we still don't have a timeline but have entry barriers, make an estimate
             if timeline is None and "entry_barriers" in market_data:
-                barriers = market_data.get("entry_barriers", {}).get("rating")
-                if barriers == "Low":
-                    timeline = 6
-                elif barriers == "Medium":
-                    timeline = 9
-                elif barriers == "High":
-                    timeline = 12
+                barriers = Rating.parse(market_data.get("entry_barriers", {}).get("rating"))
+                timeline = ENTRY_BARRIER_TIMELINE_MONTHS.get(barriers)
                 
             return timeline
             
@@ -1,9 +1,11 @@
 from typing import Dict, List, Any, Optional
-import re
-import time
 from urllib.parse import urlparse
 import json
 import requests
+from .llm_service import create_http_session, stream_json_response, try_parse_json_response
+
+# Shared keep-alive session for LLM API calls
+_SESSION = create_http_session()
 
 class WebsiteAnalyzerService:
     """
@@ -69,10 +71,7 @@ class WebsiteAnalyzerService:
             domain = parsed_url.netloc
             
             # Strip www. if present
-            if domain.startswith('www.'):
-                domain = domain[4:]
-                
-            return domain
+            return domain.removeprefix('www.')
         except Exception as e:
             print(f"Error extracting domain from URL: {str(e)}")
             return url  # Return the original URL if parsing fails
@@ -198,39 +197,25 @@ class WebsiteAnalyzerService:
         # Call LLM
         try:
             print(f"[LLM ANALYSIS] Sending request to LLM for {domain}")
-            # Make headers
-            headers = {"Content-Type": "application/json"}
-            
             # Make the data payload
             data = {
                 "model": "mistral",  # Using Ollama's Mistral model
-                "prompt": prompt,
-                "stream": False
+                "prompt": prompt
             }
             
-            # Make the request
+            # Make the request, streaming until the JSON object is complete
             api_url = "http://localhost:11434/api/generate"
-            response = requests.post(api_url, headers=headers, json=data, timeout=60)
-            
-            if response.status_code != 200:
-                print(f"[LLM ANALYSIS] Error from LLM API: {response.status_code}")
+            try:
+                llm_text = stream_json_response(_SESSION, api_url, data, timeout=60)
+            except requests.HTTPError as e:
+                print(f"[LLM ANALYSIS] Error from LLM API: {e.response.status_code}")
                 return self._get_empty_analysis_structure()
-                
-            # Parse the response
-            result = response.json()
-            llm_text = result.get("response", "{}")
             
             # Try to find and extract JSON from the response
-            json_match = re.search(r'```(?:json)?\s*({.*?})\s*```', llm_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # If not in code block, try to extract JSON directly
-                json_str = re.search(r'^(?:.+?)?({[\s\S]*})', llm_text, re.DOTALL)
-                json_str = json_str.group(1) if json_str else llm_text
-            
-            # Parse the JSON
-            analysis = json.loads(json_str)
+            analysis = try_parse_json_response(llm_text)
+            if analysis is None:
+                print(f"[LLM ANALYSIS] No JSON object in LLM response for {domain}")
+                return self._get_empty_analysis_structure()
             print(f"[LLM ANALYSIS] Successfully extracted analysis for {domain}")
             
             # Post-process to ensure all required fields are present
@@ -268,44 +253,15 @@ class WebsiteAnalyzerService:
         """Ensure the analysis has all required fields."""
         empty = self._get_empty_analysis_structure()
         
-        # Make sure all required sections exist
-        if 'products' not in analysis:
-            analysis['products'] = empty['products']
-        elif not isinstance(analysis['products'], dict):
-            analysis['products'] = empty['products']
-        else:
-            # Ensure sub-fields exist
-            for field in ['categories', 'items', 'confidence']:
-                if field not in analysis['products']:
-                    analysis['products'][field] = empty['products'][field]
-        
-        # Do the same for other sections
-        if 'markets' not in analysis:
-            analysis['markets'] = empty['markets']
-        elif not isinstance(analysis['markets'], dict):
-            analysis['markets'] = empty['markets']
-        else:
-            for field in ['current', 'confidence']:
-                if field not in analysis['markets']:
-                    analysis['markets'][field] = empty['markets'][field]
-        
-        if 'certifications' not in analysis:
-            analysis['certifications'] = empty['certifications']
-        elif not isinstance(analysis['certifications'], dict):
-            analysis['certifications'] = empty['certifications']
-        else:
-            for field in ['items', 'confidence']:
-                if field not in analysis['certifications']:
-                    analysis['certifications'][field] = empty['certifications'][field]
-        
-        if 'business_details' not in analysis:
-            analysis['business_details'] = empty['business_details']
-        elif not isinstance(analysis['business_details'], dict):
-            analysis['business_details'] = empty['business_details']
-        else:
-            for field in ['estimated_size', 'years_operating', 'confidence']:
-                if field not in analysis['business_details']:
-                    analysis['business_details'][field] = empty['business_details'][field]
+        # The empty structure doubles as the table of required sections and fields.
+        # Replace missing or malformed sections, fill in missing sub-fields.
+        for section, defaults in empty.items():
+            current = analysis.get(section)
+            if not isinstance(current, dict):
+                analysis[section] = defaults
+            else:
+                for field, value in defaults.items():
+                    current.setdefault(field, value)
         
         return analysis
     